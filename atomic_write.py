@@ -0,0 +1,57 @@
+import os
+import secrets
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Tuple
+
+# Attempts at an unused temp name before giving up, as tempfile does
+_TEMP_NAME_ATTEMPTS = 100
+
+
+def _create_temp_file(directory: str, suffix: str) -> Tuple[int, str]:
+    """
+    Create a new, uniquely named file in directory.
+    
+    The file is created with mode 0o666 so the kernel applies the umask, giving
+    it the permissions a plain open() would; O_EXCL means no other process can
+    be handed the same file.
+    
+    Returns:
+        Tuple of (open file descriptor, path)
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for _ in range(_TEMP_NAME_ATTEMPTS):
+        path = os.path.join(directory, f".{secrets.token_hex(8)}{suffix}")
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No unused temporary file name in {directory}")
+
+
+@contextmanager
+def atomic_output(path: str, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Open a binary file whose contents replace path only once fully written.
+    
+    Writes go to a temp file in the same directory, so the final os.replace is
+    an atomic rename; a failed or killed write never leaves a truncated file at
+    path, and concurrent writers of one path never share a temp file.
+    
+    Args:
+        path: Destination file path
+        buffering: Buffer size passed to open()
+    
+    Yields:
+        Buffered binary file to write the contents to
+    """
+    fd, tmp_path = _create_temp_file(os.path.dirname(path) or '.', '.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=buffering) as out:
+            yield out
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,22 +1,211 @@
+import atexit
+import io
 import os
 import pathlib
 import logging
-from typing import Optional, Dict, Any, List
+import multiprocessing
+import shutil
+import stat
+import importlib.util
+import operator
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple, Union
 
-# Aspose.Cells for production-grade Excel processing
+from atomic_write import atomic_output
+
+# Aspose.Cells for production-grade Excel processing.
+# Only probe for the package here: importing it starts the .NET runtime, which
+# takes seconds, so the real import is deferred to the first ExcelToPdfService().
 try:
-    import aspose.cells as cells
-    from aspose.cells import Workbook, SaveFormat, PageOrientationType, PaperSizeType
-    ASPOSE_AVAILABLE = True
-    logging.info("Aspose.Cells available - production Excel processing enabled")
+    ASPOSE_AVAILABLE = importlib.util.find_spec("aspose.cells") is not None
 except ImportError:
     ASPOSE_AVAILABLE = False
+
+if ASPOSE_AVAILABLE:
+    logging.info("Aspose.Cells available - production Excel processing enabled")
+else:
     logging.warning("Aspose.Cells not available. Install: pip install aspose-cells-python")
 
+cells = None  # aspose.cells, set by _load_aspose()
+
+# Enum values used for every converted sheet, captured by _load_aspose() so
+# the page setup path doesn't repeat the module and enum attribute lookups
+_PAPER_A4 = None
+_PORTRAIT = None
+_LANDSCAPE = None
+
+
+def _load_aspose():
+    """Import aspose.cells on first use and return the module."""
+    global cells, _PAPER_A4, _PORTRAIT, _LANDSCAPE
+    if cells is None:
+        import aspose.cells as aspose_cells
+        import aspose.cells.rendering  # PdfCompliance, PdfOptimizationType, SheetSet
+        import aspose.cells.drawing  # ImageType
+        _PAPER_A4 = aspose_cells.PaperSizeType.PAPER_A4
+        _PORTRAIT = aspose_cells.PageOrientationType.PORTRAIT
+        _LANDSCAPE = aspose_cells.PageOrientationType.LANDSCAPE
+        cells = aspose_cells
+    return cells
+
+
+_LICENSE_PATH: Optional[str] = None  # license applied in this process, if any
+
+
+def _apply_license(license_path: str):
+    """Apply an Aspose.Cells license once per process."""
+    global _LICENSE_PATH
+    if _LICENSE_PATH != license_path:
+        cells.License().set_license(license_path)
+        _LICENSE_PATH = license_path
+        logger.info("Aspose.Cells license applied: %s", license_path)
+
+
+_CACHE_FOLDER: Optional[str] = None  # Aspose cache folder set for this process, if any
+
+
+def _set_cache_folder(cache_dir: str):
+    """Point Aspose's file cache at a per-process subdirectory of cache_dir."""
+    global _CACHE_FOLDER
+    # The cache folder is process-global; parallel workers each get their own
+    folder = os.path.join(cache_dir, str(os.getpid()))
+    if _CACHE_FOLDER == folder:
+        return
+    set_cache_folder = getattr(cells.CellsHelper, "set_cache_folder", None)
+    if set_cache_folder is None:
+        logger.warning("This Aspose.Cells build has no cache folder support; cache_dir ignored")
+        return
+    os.makedirs(folder, exist_ok=True)
+    # Named after this pid, so nothing else uses it once the process is gone;
+    # removed at exit so a batch run doesn't leave one folder per worker behind
+    atexit.register(shutil.rmtree, folder, ignore_errors=True)
+    set_cache_folder(folder)
+    _CACHE_FOLDER = folder
+    logger.info("Aspose.Cells cache folder: %s", folder)
+
+
+# Metadata key -> document property names it may have, in order of preference;
+# the names vary across Aspose.Cells versions
+_PROP_CANDIDATES = {
+    "title": ('title',),
+    "author": ('author',),
+    "date_created": ('created_time', 'creation_date'),
+    "last_modified": ('last_modified_time', 'last_save_time', 'modified'),
+}
+
+# Metadata key -> getter for the property name this Aspose build uses,
+# resolved once per process by _property_getters()
+_PROP_GETTERS: Optional[Dict[str, Callable[[Any], Any]]] = None
+
+
+def _property_getters(props) -> Dict[str, Callable[[Any], Any]]:
+    """Return the document property getters, probing a single dir() call the first time."""
+    global _PROP_GETTERS
+    if _PROP_GETTERS is None:
+        names = set(dir(props))
+        getters = {}
+        for key, candidates in _PROP_CANDIDATES.items():
+            name = next((name for name in candidates if name in names), None)
+            if name is not None:
+                getters[key] = operator.attrgetter(name)
+        _PROP_GETTERS = getters
+    return _PROP_GETTERS
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Extensions accepted by batch_convert
+_EXCEL_EXTENSIONS = frozenset({'.xlsx', '.xls', '.xlsm'})
+
+# PDF output profiles: (PdfOptimizationType member, image resample dpi, JPEG quality,
+# ImageType member for rendered images such as charts)
+_QUALITY_PROFILES = {
+    "screen": ("MINIMUM_SIZE", 150, 85, "JPEG"),
+    "print": ("STANDARD", 300, 100, "PNG"),
+}
+
+# Page margins in inches, reduced for better space utilization
+_PAGE_MARGINS = (
+    ("left_margin", 0.5),
+    ("right_margin", 0.5),
+    ("top_margin", 0.5),
+    ("bottom_margin", 0.5),
+    ("header_margin", 0.3),
+    ("footer_margin", 0.3),
+)
+
+# Functions whose results change without their inputs changing, so a formula
+# using them can't rely on the value cached in the file
+_VOLATILE_FUNCTIONS = ("NOW(", "TODAY(", "RAND(", "RANDBETWEEN(", "OFFSET(", "INDIRECT(")
+
+# Document property elements of an OOXML docProps/core.xml part
+_CORE_PROPERTY_TAGS = {
+    "{http://purl.org/dc/elements/1.1/}title": "title",
+    "{http://purl.org/dc/elements/1.1/}creator": "author",
+    "{http://purl.org/dc/terms/}created": "date_created",
+    "{http://purl.org/dc/terms/}modified": "last_modified",
+}
+
+
+def _read_ooxml_metadata(excel_path: str) -> Dict[str, Any]:
+    """Read sheet names and core properties straight from an .xlsx/.xlsm package."""
+    with zipfile.ZipFile(excel_path) as package:
+        part_names = set(package.namelist())
+        
+        # Sheets are listed in order under <sheets>; stop before definedNames etc.
+        worksheet_names = []
+        with package.open("xl/workbook.xml") as part:
+            for _, element in ET.iterparse(part):
+                tag = element.tag.rpartition("}")[2]
+                if tag == "sheet":
+                    worksheet_names.append(element.get("name"))
+                elif tag == "sheets":
+                    break
+        
+        properties = dict.fromkeys(_CORE_PROPERTY_TAGS.values())
+        if "docProps/core.xml" in part_names:
+            root = ET.fromstring(package.read("docProps/core.xml"))
+            for element in root:
+                key = _CORE_PROPERTY_TAGS.get(element.tag)
+                if key is not None and element.text:
+                    properties[key] = element.text.strip() or None
+    
+    return {
+        "title": properties["title"],
+        "sheets_count": len(worksheet_names),
+        "author": properties["author"],
+        "has_macros": "xl/vbaProject.bin" in part_names,
+        "worksheet_names": worksheet_names,
+        "date_created": properties["date_created"],
+        "last_modified": properties["last_modified"],
+    }
+
+
+def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached metadata dict, with its own worksheet_names list, for a caller."""
+    copied = dict(metadata)
+    if "worksheet_names" in copied:
+        copied["worksheet_names"] = list(copied["worksheet_names"])
+    return copied
+
+
+# Batch inputs: plain paths, or entries from os.scandir() whose cached stat is reused
+BatchInput = Union[str, os.DirEntry]
+
+
+def _split_batch_input(item: BatchInput) -> Tuple[str, Optional[os.stat_result]]:
+    """Return the path of a batch input plus its stat when already known."""
+    if isinstance(item, os.DirEntry):
+        try:
+            return item.path, item.stat()
+        except OSError:
+            return item.path, None
+    return item, None
+
 
 class ExcelToPdfService:
     """
@@ -25,149 +214,493 @@ class ExcelToPdfService:
     Configured for a default zoom and landscape orientation.
     """
     
-    def __init__(self, default_zoom_scale: int = 70, default_orientation: str = "landscape"):
+    __slots__ = (
+        "default_zoom_scale", "default_orientation", "quality", "max_workers",
+        "_workbook_cls", "_pdf_opts", "_sheet_set_cls", "_access_cache_opts",
+        "_load_opts", "_metadata_load_opts", "_structure_load_opts", "_memory_setting", "_init_kwargs",
+        "_wb_cache", "_calculated_workbooks", "_sheet_index_cache",
+        "_workbook_keys", "_rendered_pdfs", "_meta_cache", "_recalc_needed",
+        "_file_sheet_index",
+    )
+    
+    # Number of parsed workbooks kept for reuse between metadata and conversion
+    WORKBOOK_CACHE_SIZE = 2
+    # Number of metadata results remembered per service instance
+    METADATA_CACHE_SIZE = 256
+    # Number of files whose recalculation check is remembered per service instance
+    RECALC_CHECK_CACHE_SIZE = 256
+    # Write buffer for PDF output; multi-MB PDFs on network shares need few, large writes
+    SAVE_BUFFER_SIZE = 4 * 1024 * 1024
+    
+    def __init__(self, default_zoom_scale: int = 70, default_orientation: str = "landscape",
+                 prewarm: bool = False, use_access_cache: bool = True,
+                 quality: str = "screen", license_path: Optional[str] = None,
+                 memory_preference: bool = True, max_workers: Optional[int] = None,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the Excel to PDF service.
         
         Args:
             default_zoom_scale: Default zoom percentage for PDF output (70 = 70%)
             default_orientation: Default page orientation ("portrait", "landscape")
+            prewarm: Render an empty workbook up front so the first real
+                conversion doesn't pay the Aspose runtime start-up cost
+            use_access_cache: Cache Aspose's cell/style/formula lookups while a
+                workbook is recalculated and rendered; turn off for tiny files
+                where building the cache costs more than it saves
+            quality: PDF output profile: "screen" (smaller, faster, 150 dpi
+                images) or "print" (standard optimization, 300 dpi images)
+            license_path: Aspose.Cells license file, applied once per process
+            memory_preference: Keep cell data in Aspose's compact representation;
+                turn off for string- or formula-dominated workbooks
+            max_workers: Default number of batch worker processes. If None,
+                uses the CPU count; 1 converts batches sequentially.
+            cache_dir: Directory for Aspose's on-disk cache of workbook data,
+                trading disk I/O for RAM on very large files; each process
+                uses its own subdirectory
         """
+        if quality not in _QUALITY_PROFILES:
+            raise ValueError(f"Unknown quality {quality!r}, expected one of {sorted(_QUALITY_PROFILES)}")
+        
         if not ASPOSE_AVAILABLE:
             raise ImportError(
                 "Aspose.Cells is required for production use. "
                 "Install with: pip install aspose-cells-python"
             )
         
+        aspose_cells = _load_aspose()
+        if license_path:
+            _apply_license(license_path)
+        if cache_dir:
+            _set_cache_folder(cache_dir)
+        self._workbook_cls = aspose_cells.Workbook
+        self.quality = quality
+        
+        # PDF save options built once and reused for every full-workbook save
+        self._pdf_opts = self._new_pdf_opts()
+        
+        # SheetSet selects sheets at render time; older Aspose builds lack it
+        try:
+            from aspose.cells.rendering import SheetSet
+            self._sheet_set_cls = SheetSet if hasattr(self._pdf_opts, "sheet_set") else None
+        except ImportError:
+            self._sheet_set_cls = None
+        
+        # Lookup caches held open across recalculation, page setup and render
+        self._access_cache_opts = aspose_cells.AccessCacheOptions.ALL if use_access_cache else None
+        
+        # MEMORY_PREFERENCE keeps cell data in Aspose's compact representation, which
+        # sharply cuts memory on large numeric sheets. Access to string- or
+        # formula-heavy sheets gets somewhat slower in exchange.
+        memory_setting = (
+            aspose_cells.MemorySetting.MEMORY_PREFERENCE if memory_preference
+            else aspose_cells.MemorySetting.NORMAL
+        )
+        self._memory_setting = memory_setting
+        self._load_opts = aspose_cells.LoadOptions()
+        self._load_opts.memory_setting = memory_setting
+        
+        # Metadata-only loads skip cell data, charts and shapes entirely
+        filter_options = aspose_cells.LoadDataFilterOptions
+        self._metadata_load_opts = aspose_cells.LoadOptions()
+        self._metadata_load_opts.memory_setting = memory_setting
+        self._metadata_load_opts.load_filter = aspose_cells.LoadFilter(
+            filter_options.DOCUMENT_PROPERTIES | filter_options.STRUCTURE | filter_options.VBA
+        )
+        
+        # Sheet-name probes only need the workbook structure
+        self._structure_load_opts = aspose_cells.LoadOptions()
+        self._structure_load_opts.memory_setting = memory_setting
+        self._structure_load_opts.load_filter = aspose_cells.LoadFilter(filter_options.STRUCTURE)
+        
         self.default_zoom_scale = default_zoom_scale
         self.default_orientation = default_orientation
+        self.max_workers = max_workers
+        
+        # Constructor arguments, used to rebuild the service in batch worker processes
+        self._init_kwargs = {
+            "default_zoom_scale": default_zoom_scale,
+            "default_orientation": default_orientation,
+            "use_access_cache": use_access_cache,
+            "quality": quality,
+            "license_path": license_path,
+            "memory_preference": memory_preference,
+            "cache_dir": cache_dir
+        }
+        
+        # Parsed workbooks keyed by (path, mtime, size) so an unchanged file is loaded once
+        self._wb_cache: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+        # ids of cached workbooks whose formulas are already up to date
+        self._calculated_workbooks: set = set()
+        # Sheet name -> index maps of cached workbooks, keyed by workbook id
+        self._sheet_index_cache: Dict[int, Dict[str, int]] = {}
+        # Cache key of each cached workbook, keyed by workbook id
+        self._workbook_keys: Dict[int, Tuple[str, int, int]] = {}
+        # Render digest of the last PDF written to each path, with that file's (mtime_ns, size)
+        self._rendered_pdfs: Dict[str, Tuple[Tuple, int, int]] = {}
+        # Metadata results under the same key
+        self._meta_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        # Sheet name -> index maps of files probed without a full load, under the same key
+        self._file_sheet_index: "OrderedDict[Tuple[str, int, int], Dict[str, int]]" = OrderedDict()
+        # Whether each file needs recalculation, under the same key; outlives the workbook cache
+        self._recalc_needed: "OrderedDict[Tuple[str, int, int], bool]" = OrderedDict()
+        
+        if prewarm:
+            self._prewarm()
+    
+    def _new_pdf_opts(self):
+        """Build PdfSaveOptions with the service's document-level settings."""
+        pdf_opts = cells.PdfSaveOptions()
+        pdf_opts.one_page_per_sheet = False
+        # Plain PDF 1.5 output; the text-and-numbers sheets this service renders
+        # need none of the newer features
+        pdf_opts.compliance = cells.rendering.PdfCompliance.PDF15
+        # Image resolution is set once for the document rather than through each
+        # sheet's print_quality
+        optimization, image_dpi, jpeg_quality, image_type = _QUALITY_PROFILES[self.quality]
+        pdf_opts.optimization_type = getattr(cells.rendering.PdfOptimizationType, optimization)
+        pdf_opts.set_image_resample(image_dpi, jpeg_quality)
+        pdf_opts.image_type = getattr(cells.drawing.ImageType, image_type)
+        return pdf_opts
     
-    def get_excel_metadata(self, excel_path: str) -> Dict[str, Any]:
-        """Extract metadata from Excel file."""
+    def _prewarm(self):
+        """Load and render an empty workbook to initialize the Aspose runtime."""
         try:
-            workbook = Workbook(excel_path) # type: ignore
-            
-            # Get file info
+            self._workbook_cls().save(io.BytesIO(), self._pdf_opts)
+            logger.info("Aspose.Cells runtime pre-warmed")
+        except Exception as e:
+            logger.warning("Aspose.Cells pre-warm failed: %s", e)
+    
+    @staticmethod
+    def _file_key(excel_path: str, file_stat: Optional[os.stat_result] = None) -> Tuple[str, int, int]:
+        """Cheap identity of a file's current contents: (path, mtime_ns, size)."""
+        if file_stat is None:
             file_stat = os.stat(excel_path)
-            file_size_mb = file_stat.st_size / (1024 * 1024)
+        return (os.path.abspath(excel_path), file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def _load_workbook(self, excel_path: str, key: Optional[Tuple[str, int, int]] = None):
+        """Load a workbook, reusing the cached instance if the file is unchanged."""
+        if key is None:
+            key = self._file_key(excel_path)
+        
+        workbook = self._wb_cache.get(key)
+        if workbook is not None:
+            self._wb_cache.move_to_end(key)
+            return workbook
+        
+        workbook = self._open_workbook(excel_path)
+        self._wb_cache[key] = workbook
+        self._workbook_keys[id(workbook)] = key
+        while len(self._wb_cache) > self.WORKBOOK_CACHE_SIZE:
+            _, evicted = self._wb_cache.popitem(last=False)
+            self._forget_workbook(evicted)
+        return workbook
+    
+    def _open_workbook(self, excel_path: str):
+        """Load a fresh workbook with the service's load and memory settings."""
+        workbook = self._workbook_cls(excel_path, self._load_opts)
+        # LoadOptions covers the loaded sheets; the workbook setting covers any added later
+        workbook.settings.memory_setting = self._memory_setting
+        return workbook
+    
+    def _release_workbook(self, key: Tuple[str, int, int]):
+        """Evict a workbook from the cache and free its native memory."""
+        workbook = self._wb_cache.pop(key, None)
+        if workbook is None:
+            return
+        self._forget_workbook(workbook)
+        try:
+            workbook.dispose()
+        except Exception as e:
+            logger.warning("Failed to dispose workbook %s: %s", key[0], e)
+    
+    def _is_spreadsheet(self, excel_path: str, key: Tuple[str, int, int]) -> bool:
+        """Check the file header for a spreadsheet format Aspose can load."""
+        if key in self._wb_cache:
+            return True
+        # Only the first few KB are read, unlike a full load
+        try:
+            file_format = cells.FileFormatUtil.detect_file_format(excel_path)
+        except Exception as e:
+            logger.error("Could not detect file format of %s: %s", excel_path, e)
+            return False
+        if file_format.load_format == cells.LoadFormat.UNKNOWN:
+            logger.error("Not a spreadsheet file: %s", excel_path)
+            return False
+        return True
+    
+    def _forget_workbook(self, workbook):
+        """Drop per-workbook state kept alongside the workbook cache."""
+        self._calculated_workbooks.discard(id(workbook))
+        self._sheet_index_cache.pop(id(workbook), None)
+        self._workbook_keys.pop(id(workbook), None)
+    
+    def _sheet_index_map(self, workbook) -> Dict[str, int]:
+        """Return a sheet name -> index map, built once per cached workbook."""
+        index_map = self._sheet_index_cache.get(id(workbook))
+        if index_map is None:
+            index_map = {worksheet.name: i for i, worksheet in enumerate(workbook.worksheets)}
+            self._sheet_index_cache[id(workbook)] = index_map
+        return index_map
+    
+    def _file_sheet_index_map(self, excel_path: str, key: Tuple[str, int, int]) -> Dict[str, int]:
+        """Return a file's sheet name -> index map, probing with a structure-only load if needed."""
+        workbook = self._wb_cache.get(key)
+        if workbook is not None:
+            return self._sheet_index_map(workbook)
+        
+        index_map = self._file_sheet_index.get(key)
+        if index_map is not None:
+            self._file_sheet_index.move_to_end(key)
+            return index_map
+        
+        probe = self._workbook_cls(excel_path, self._structure_load_opts)
+        try:
+            index_map = {worksheet.name: i for i, worksheet in enumerate(probe.worksheets)}
+        finally:
+            probe.dispose()
+        self._file_sheet_index[key] = index_map
+        while len(self._file_sheet_index) > self.METADATA_CACHE_SIZE:
+            self._file_sheet_index.popitem(last=False)
+        return index_map
+    
+    def _workbook_needs_recalc(self, workbook) -> bool:
+        """
+        Check whether the values cached in the file can be rendered as they are.
+        
+        Recalculation is needed if the file was saved in manual calculation
+        mode (its cached values may predate the last edit), if it asks for a
+        full calculation on load, or if any formula has no cached value or
+        uses a volatile function. Formula cells are visited with Aspose's
+        native search. The setting names differ between Aspose versions, so
+        both spellings are read; _recalculate memoizes the answer per file.
+        """
+        try:
+            settings = workbook.settings
+            formula_settings = getattr(settings, "formula_settings", None)
+            calc_mode = getattr(formula_settings, "calculation_mode", None)
+            if calc_mode is None:
+                calc_mode = getattr(settings, "calc_mode", None)
+            calc_mode_types = getattr(cells, "CalcModeType", None)
+            if calc_mode is not None and (
+                    calc_mode == getattr(calc_mode_types, "MANUAL", None)
+                    or str(calc_mode).upper().endswith("MANUAL")):
+                return True
             
-            # Get worksheet count safely
-            try:
-                sheets_count = len(workbook.worksheets) # type: ignore
-            except Exception:
-                sheets_count = 0
+            if (getattr(formula_settings, "force_full_calculation", False)
+                    or getattr(settings, "force_full_calculate", False)):
+                return True
             
-            # Get worksheet names safely
-            worksheet_names = []
-            try:
-                for i in range(sheets_count):
-                    worksheet_names.append(workbook.worksheets[i].name)
-            except:
-                worksheet_names = []
+            options = cells.FindOptions()
+            options.look_in_type = cells.LookInType.ONLY_FORMULAS
+            options.look_at_type = cells.LookAtType.START_WITH
             
-            # Extract built-in document properties with safe attribute access
+            for worksheet in workbook.worksheets:
+                sheet_cells = worksheet.cells
+                cell = sheet_cells.find("=", None, options)
+                while cell is not None:
+                    if cell.value is None:
+                        return True
+                    formula = cell.formula.upper()
+                    if any(name in formula for name in _VOLATILE_FUNCTIONS):
+                        return True
+                    cell = sheet_cells.find("=", cell, options)
+            return False
+        except Exception as e:
+            # When in doubt, recalculate
+            logger.warning("Could not scan workbook formulas: %s", e)
+            return True
+    
+    def _recalculate(self, workbook):
+        """Calculate all formulas unless the cached values are current or already recalculated."""
+        if id(workbook) in self._calculated_workbooks:
+            logger.info("Formulas already recalculated for this workbook")
+            return
+        
+        key = self._workbook_keys.get(id(workbook))
+        if key is None:
+            # Caller-owned (load_workbook): cells may have been edited since it
+            # was loaded, which the saved-values scan can't see
+            needs_recalc = True
+        else:
+            needs_recalc = self._recalc_needed.get(key)
+        if needs_recalc is None:
+            needs_recalc = self._workbook_needs_recalc(workbook)
+            self._recalc_needed[key] = needs_recalc
+            while len(self._recalc_needed) > self.RECALC_CHECK_CACHE_SIZE:
+                self._recalc_needed.popitem(last=False)
+        
+        if needs_recalc:
+            workbook.calculate_formula()
+            logger.info("All formulas recalculated successfully")
+        else:
+            logger.info("Cached formula results are current - skipping recalculation")
+        
+        # Only cached workbooks are tracked; forget_workbook clears their ids on
+        # eviction, where an untracked workbook's id could be reused by another
+        if id(workbook) in self._workbook_keys:
+            self._calculated_workbooks.add(id(workbook))
+    
+    def get_excel_metadata(self, excel_path: str,
+                           file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from Excel file.
+        
+        Args:
+            excel_path: Path to input Excel file
+            file_stat: os.stat() result the caller already has for excel_path
+        
+        Returns:
+            Dict of workbook metadata, empty on failure
+        """
+        try:
+            # One stat serves the cache key and the file size
+            if file_stat is None:
+                file_stat = os.stat(excel_path)
+            key = self._file_key(excel_path, file_stat)
+            cached = self._meta_cache.get(key)
+            if cached is not None:
+                self._meta_cache.move_to_end(key)
+                return _copy_metadata(cached)
+            
+            # Reuse a fully parsed workbook if one is cached, otherwise do a
+            # properties/structure-only load that is not kept for conversion
+            workbook = self._wb_cache.get(key)
+            probe = None
+            if workbook is None:
+                workbook = probe = self._workbook_cls(excel_path, self._metadata_load_opts)
             try:
-                props = workbook.built_in_document_properties
-                title = props.title if hasattr(props, 'title') and props.title else None
-                author = props.author if hasattr(props, 'author') and props.author else None
-            except:
-                title = None
-                author = None
-            
-            # Check for macros safely
+                metadata = self._metadata_from_workbook(workbook, excel_path, file_stat)
+            finally:
+                if probe is not None:
+                    probe.dispose()
+            if metadata:
+                self._meta_cache[key] = metadata
+                while len(self._meta_cache) > self.METADATA_CACHE_SIZE:
+                    self._meta_cache.popitem(last=False)
+            return _copy_metadata(metadata)
+        except Exception as e:
+            logger.error("Failed to extract Excel metadata: %s", e)
+            return {}
+    
+    def get_excel_metadata_fast(self, excel_path: str) -> Dict[str, Any]:
+        """
+        Extract metadata without an Aspose parse where possible.
+        
+        .xlsx/.xlsm files are read as zip packages: only xl/workbook.xml and
+        docProps/core.xml are parsed. Dates are the ISO 8601 strings stored
+        in the file. .xls files, and packages that can't be read this way,
+        fall back to get_excel_metadata.
+        
+        Args:
+            excel_path: Path to input Excel file
+        
+        Returns:
+            Dict with the same keys as get_excel_metadata
+        """
+        if os.path.splitext(excel_path)[1].lower() in ('.xlsx', '.xlsm'):
             try:
-                has_macros = workbook.has_macro if hasattr(workbook, 'has_macro') else False
-            except:
-                has_macros = False
+                metadata = _read_ooxml_metadata(excel_path)
+                metadata["file_size_mb"] = round(os.path.getsize(excel_path) / (1024 * 1024), 2)
+                return metadata
+            except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+                logger.warning("Fast metadata read failed for %s, using Aspose: %s", excel_path, e)
+        return self.get_excel_metadata(excel_path)
+    
+    def _metadata_from_workbook(self, workbook, excel_path: str,
+                                file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Extract metadata from an already loaded workbook."""
+        try:
+            # Get file info
+            if file_stat is None:
+                file_stat = os.stat(excel_path)
+            file_size_mb = file_stat.st_size / (1024 * 1024)
+            
+            worksheet_names = [worksheet.name for worksheet in workbook.worksheets]
+            sheets_count = len(worksheet_names)
+            
+            # Fetch the built-in document properties once; one failing property
+            # doesn't cost the rest of the metadata
+            props = workbook.built_in_document_properties
+            values = {}
+            for key, getter in _property_getters(props).items():
+                try:
+                    values[key] = getter(props)
+                except Exception as e:
+                    logger.debug("Could not read document property %s: %s", key, e)
+            
+            # Check for macros
+            has_macros = bool(getattr(workbook, 'has_macro', False))
+            
+            created = values.get("date_created")
+            modified = values.get("last_modified")
             
             metadata = {
-                "title": title,
+                "title": values.get("title") or None,
                 "sheets_count": sheets_count,
                 "file_size_mb": round(file_size_mb, 2),
-                "author": author,
+                "author": values.get("author") or None,
                 "has_macros": has_macros,
-                "worksheet_names": worksheet_names
+                "worksheet_names": worksheet_names,
+                "date_created": str(created) if created is not None else None,
+                "last_modified": str(modified) if modified is not None else None
             }
             
-            # Try to get creation and modification times with different possible attribute names
-            try:
-                props = workbook.built_in_document_properties
-                if hasattr(props, 'created_time'):
-                    metadata["date_created"] = str(props.created_time)
-                elif hasattr(props, 'creation_date'):
-                    metadata["date_created"] = str(props.creation_date) # type: ignore
-                else:
-                    metadata["date_created"] = None
-            except:
-                metadata["date_created"] = None
-                
-            try:
-                props = workbook.built_in_document_properties
-                if hasattr(props, 'last_modified_time'):
-                    metadata["last_modified"] = str(props.last_modified_time) # type: ignore
-                elif hasattr(props, 'last_save_time'):
-                    metadata["last_modified"] = str(props.last_save_time) # type: ignore
-                elif hasattr(props, 'modified'):
-                    metadata["last_modified"] = str(props.modified) # type: ignore
-                else:
-                    metadata["last_modified"] = None
-            except:
-                metadata["last_modified"] = None
-            
             return metadata
             
         except Exception as e:
-            logger.error(f"Failed to extract Excel metadata: {e}")
+            logger.error("Failed to extract Excel metadata: %s", e)
             return {}
     
-    def _configure_page_setup(self, worksheet, orientation: Optional[str] = None, zoom_scale: Optional[int] = None):
+    def _resolve_page_params(self, orientation: Optional[str] = None,
+                             zoom_scale: Optional[int] = None) -> Tuple[Any, int]:
         """
-        Configure page setup for optimal PDF output.
+        Resolve orientation and zoom against the defaults, once per conversion.
         
         Args:
-            worksheet: The worksheet to configure
             orientation: Page orientation ("portrait", "landscape"). If None, uses default.
             zoom_scale: Manual zoom percentage. If None, uses default.
+        
+        Returns:
+            Tuple of (PageOrientationType, zoom percentage)
+        """
+        final_orientation = orientation if orientation is not None else self.default_orientation
+        if final_orientation == "portrait":
+            orientation_type = _PORTRAIT
+        else: # Landscape, which is also the fallback for "auto" or invalid values
+            orientation_type = _LANDSCAPE
+        final_zoom_scale = zoom_scale if zoom_scale is not None else self.default_zoom_scale
+        return orientation_type, final_zoom_scale
+    
+    def _configure_page_setup(self, worksheet, page_params: Tuple[Any, int]):
+        """
+        Configure page setup for optimal PDF output.
+        
+        Args:
+            worksheet: The worksheet to configure
+            page_params: (orientation type, zoom) from _resolve_page_params
         """
         try:
             page_setup = worksheet.page_setup
+            orientation_type, zoom_scale = page_params
             
             # Set paper size to A4
-            page_setup.paper_size = PaperSizeType.PAPER_A4
-            
-            # Configure scaling options
-            final_zoom_scale = zoom_scale if zoom_scale is not None else self.default_zoom_scale
-            page_setup.zoom = final_zoom_scale
-            logger.info(f"Applied manual zoom: {final_zoom_scale}%")
-            
-            # Set orientation
-            final_orientation = orientation if orientation is not None else self.default_orientation
-            if final_orientation == "landscape":
-                page_setup.orientation = PageOrientationType.LANDSCAPE
-                logger.info("Set orientation: Landscape")
-            elif final_orientation == "portrait":
-                page_setup.orientation = PageOrientationType.PORTRAIT
-                logger.info("Set orientation: Portrait")
-            else: # Default to landscape if "auto" or invalid
-                page_setup.orientation = PageOrientationType.LANDSCAPE
-                logger.info("Default orientation: Landscape")
+            page_setup.paper_size = _PAPER_A4
+            
+            # Scaling and orientation
+            page_setup.zoom = zoom_scale
+            page_setup.orientation = orientation_type
             
             # Set margins for better space utilization
-            page_setup.left_margin = 0.5
-            page_setup.right_margin = 0.5
-            page_setup.top_margin = 0.5
-            page_setup.bottom_margin = 0.5
-            page_setup.header_margin = 0.3
-            page_setup.footer_margin = 0.3
-            
-            # Print quality and other options
-            page_setup.print_quality = 300
-            page_setup.print_draft = False
+            for name, inches in _PAGE_MARGINS:
+                setattr(page_setup, name, inches)
+            
+            # Gridlines and headings are page-setup only, with no PdfSaveOptions equivalent
             page_setup.print_gridlines = True  # Show gridlines in PDF
             page_setup.print_headings = False  # Don't show row/column headers
             
         except Exception as e:
-            logger.error(f"Failed to configure page setup: {e}")
+            logger.error("Failed to configure page setup: %s", e)
     
     def convert_excel_to_pdf(self, excel_path: str, pdf_path: str, 
                            sheet_indices: Optional[List[int]] = None,
@@ -180,7 +713,8 @@ class ExcelToPdfService:
         Args:
             excel_path: Path to input Excel file
             pdf_path: Path for output PDF file
-            sheet_indices: List of sheet indices to convert (None = all sheets)
+            sheet_indices: List of sheet indices to convert, rendered in the
+                order given (None = all sheets)
             recalculate_formulas: Whether to recalculate formulas before export
             orientation: Page orientation ("portrait", "landscape"). If None, uses default.
             zoom_scale: Manual zoom percentage. If None, uses default.
@@ -188,64 +722,224 @@ class ExcelToPdfService:
         Returns:
             bool: True if conversion successful, False otherwise
         """
+        # Fail fast on bad input before paying for a full workbook load
         try:
-            logger.info(f"Converting Excel to PDF: {excel_path} -> {pdf_path}")
+            file_stat = os.stat(excel_path)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            logger.error("File not found: %s", excel_path)
+            return False
+        
+        try:
+            logger.info("Converting Excel to PDF: %s -> %s", excel_path, pdf_path)
+            os.makedirs(os.path.dirname(pdf_path) or '.', exist_ok=True)
+            
+            key = self._file_key(excel_path, file_stat)
+            if not self._is_spreadsheet(excel_path, key):
+                return False
             
             # Load workbook
-            workbook = Workbook(excel_path) # type: ignore
+            workbook = self._load_workbook(excel_path, key)
+        except Exception as e:
+            logger.error("Failed to convert Excel to PDF: %s", e)
+            return False
+        
+        return self._convert_workbook_to_pdf(
+            workbook, pdf_path,
+            sheet_indices=sheet_indices,
+            recalculate_formulas=recalculate_formulas,
+            orientation=orientation,
+            zoom_scale=zoom_scale
+        )
+    
+    def load_workbook(self, excel_path: str):
+        """
+        Load a workbook for repeated conversions with convert_workbook.
+        
+        The workbook is the caller's own, outside the service's cache, so it
+        may be edited between conversions. Each convert_workbook call with
+        recalculate_formulas=True recalculates it; pass False for later
+        renders of an unchanged workbook. Call dispose() when done with it.
+        
+        Args:
+            excel_path: Path to input Excel file
+        
+        Returns:
+            Loaded Aspose.Cells Workbook
+        """
+        return self._open_workbook(excel_path)
+    
+    def convert_workbook(self, workbook, pdf_path: str,
+                         sheet_indices: Optional[List[int]] = None,
+                         recalculate_formulas: bool = True,
+                         orientation: Optional[str] = None,
+                         zoom_scale: Optional[int] = None) -> bool:
+        """
+        Convert an already loaded workbook to PDF.
+        
+        Takes the same options as convert_excel_to_pdf. Page setup changes are
+        cheap, so one workbook can be rendered with several option sets. The
+        workbook may have been edited, so the PDF is always rendered; the
+        up-to-date check of convert_excel_to_pdf does not apply.
+        
+        Args:
+            workbook: Workbook from load_workbook (or any Aspose.Cells Workbook)
+            pdf_path: Path for output PDF file
+        
+        Returns:
+            bool: True if conversion successful, False otherwise
+        """
+        return self._convert_workbook_to_pdf(
+            workbook, pdf_path,
+            sheet_indices=sheet_indices,
+            recalculate_formulas=recalculate_formulas,
+            orientation=orientation,
+            zoom_scale=zoom_scale
+        )
+    
+    def _convert_workbook_to_pdf(self, workbook, pdf_path: str,
+                                 sheet_indices: Optional[List[int]] = None,
+                                 recalculate_formulas: bool = True,
+                                 orientation: Optional[str] = None,
+                                 zoom_scale: Optional[int] = None) -> bool:
+        """
+        Convert an already loaded workbook to PDF.
+        
+        Takes the same options as convert_excel_to_pdf.
+        """
+        # Identical input file and render options give an identical PDF; skip the
+        # render if the output written for that digest is still untouched on disk
+        render_digest = self._render_digest(
+            workbook, sheet_indices, recalculate_formulas, orientation, zoom_scale
+        )
+        if render_digest is not None and self._is_rendered(pdf_path, render_digest):
+            logger.info("PDF already up to date: %s", pdf_path)
+            return True
+        
+        cache_started = False
+        try:
+            # Cell data is not modified until close_access_cache, so Aspose can
+            # reuse its lookups between recalculation and rendering
+            if self._access_cache_opts is not None:
+                workbook.start_access_cache(self._access_cache_opts)
+                cache_started = True
             
             # Critical: Calculate all formulas before export
             # This ensures P&L and BS calculations are current
             if recalculate_formulas:
-                workbook.calculate_formula()
-                logger.info("All formulas recalculated successfully")
+                self._recalculate(workbook)
             
-            # Get worksheet count safely
-            try:
-                total_sheets = len(workbook.worksheets) # type: ignore
-            except Exception:
-                total_sheets = 1
+            # Walk the native collection once; later lookups index the Python list
+            worksheets = workbook.worksheets
+            sheets = list(worksheets)
+            total_sheets = len(sheets)
+            
+            target_indices = list(range(total_sheets))
+            hidden_state = None
+            pdf_opts = self._pdf_opts
             
-            # If specific sheets are requested, create a new workbook with only those sheets
+            # If specific sheets are requested, select them at render time instead of
+            # copying the selection into a second workbook
             if sheet_indices is not None:
-                logger.info(f"Converting specific sheets: {sheet_indices}")
+                logger.info("Converting specific sheets: %s", sheet_indices)
                 
-                # Create new workbook for selected sheets
-                new_workbook = Workbook() # type: ignore
-                # Remove default sheet
-                new_workbook.worksheets.remove_at(0) # type: ignore
+                # Caller's order, each sheet once
+                target_indices = list(dict.fromkeys(
+                    i for i in sheet_indices if 0 <= i < total_sheets
+                ))
+                if not target_indices:
+                    logger.error("No valid sheet indices in %s", sheet_indices)
+                    return False
                 
-                for i, sheet_index in enumerate(sheet_indices):
-                    if 0 <= sheet_index < total_sheets:
-                        # Copy worksheet
-                        source_sheet = workbook.worksheets[sheet_index]
-                        new_workbook.worksheets.add(source_sheet.name)
-                        target_sheet = new_workbook.worksheets[i]
-                        target_sheet.copy(source_sheet)
+                if self._sheet_set_cls is not None:
+                    pdf_opts = self._new_pdf_opts()
+                    pdf_opts.sheet_set = self._sheet_set_cls(target_indices)
+                else:
+                    # Fallback: hide the other sheets in place (hidden sheets are not
+                    # rendered); this can only keep the workbook's sheet order
+                    selected = set(target_indices)
+                    hidden_state = (
+                        worksheets.active_sheet_index,
+                        [worksheet.is_visible for worksheet in sheets]
+                    )
+                    worksheets.active_sheet_index = target_indices[0]
+                    for i, worksheet in enumerate(sheets):
+                        worksheet.is_visible = i in selected
+            
+            try:
+                # Configure page setup for the exported worksheets; logged once, not per sheet
+                page_params = self._resolve_page_params(orientation, zoom_scale)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Configuring page setup for PDF output (zoom %s%%, %s)...",
+                        page_params[1],
+                        "portrait" if page_params[0] == _PORTRAIT else "landscape"
+                    )
+                for i in target_indices:
+                    self._configure_page_setup(sheets[i], page_params)
                 
-                workbook = new_workbook
-                if recalculate_formulas:
-                    workbook.calculate_formula()
-            
-            # Configure page setup for all worksheets
-            logger.info("Configuring page setup for optimal PDF output (zoom 70%, landscape)...")
-            for i in range(len(workbook.worksheets)):
-                worksheet = workbook.worksheets[i]
-                self._configure_page_setup(
-                    worksheet, 
-                    orientation=orientation,
-                    zoom_scale=zoom_scale
-                )
+                # Save as PDF
+                self._save_pdf(workbook, pdf_path, pdf_opts)
+            finally:
+                # Restore visibility so the cached workbook stays faithful to the file
+                if hidden_state is not None:
+                    active_index, visibility = hidden_state
+                    for worksheet, is_visible in zip(sheets, visibility):
+                        worksheet.is_visible = is_visible
+                    worksheets.active_sheet_index = active_index
             
-            # Save as PDF using SaveFormat
-            workbook.save(pdf_path, SaveFormat.PDF) # type: ignore
+            self._remember_render(pdf_path, render_digest)
             
-            logger.info(f"Successfully converted Excel to PDF: {pdf_path}")
+            logger.info("Successfully converted Excel to PDF: %s", pdf_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to convert Excel to PDF: {e}")
+            logger.error("Failed to convert Excel to PDF: %s", e)
             return False
+        finally:
+            if cache_started:
+                workbook.close_access_cache(self._access_cache_opts)
+    
+    def _save_pdf(self, workbook, pdf_path: str, pdf_opts):
+        """Save through a large buffer to a temp file, then move it into place."""
+        with atomic_output(pdf_path, buffering=self.SAVE_BUFFER_SIZE) as out:
+            workbook.save(out, pdf_opts)
+    
+    def _render_digest(self, workbook, sheet_indices: Optional[List[int]],
+                       recalculate_formulas: bool, orientation: Optional[str],
+                       zoom_scale: Optional[int]) -> Optional[Tuple]:
+        """Digest of everything that determines the rendered PDF, or None if unknown."""
+        file_key = self._workbook_keys.get(id(workbook))
+        if file_key is None:
+            return None
+        return (
+            file_key,
+            tuple(dict.fromkeys(sheet_indices)) if sheet_indices is not None else None,
+            recalculate_formulas,
+            orientation if orientation is not None else self.default_orientation,
+            zoom_scale if zoom_scale is not None else self.default_zoom_scale
+        )
+    
+    def _is_rendered(self, pdf_path: str, render_digest: Tuple) -> bool:
+        """Check whether pdf_path still holds the output of an identical render."""
+        rendered = self._rendered_pdfs.get(os.path.abspath(pdf_path))
+        if rendered is None or rendered[0] != render_digest:
+            return False
+        try:
+            pdf_stat = os.stat(pdf_path)
+        except OSError:
+            return False
+        return (pdf_stat.st_mtime_ns, pdf_stat.st_size) == rendered[1:]
+    
+    def _remember_render(self, pdf_path: str, render_digest: Optional[Tuple]):
+        """Record the digest of the PDF just written to pdf_path."""
+        if render_digest is None:
+            return
+        pdf_stat = os.stat(pdf_path)
+        self._rendered_pdfs[os.path.abspath(pdf_path)] = (
+            render_digest, pdf_stat.st_mtime_ns, pdf_stat.st_size
+        )
     
     def convert_sheet_to_pdf(self, excel_path: str, pdf_path: str, 
                            sheet_name: str, recalculate_formulas: bool = True,
@@ -266,21 +960,17 @@ class ExcelToPdfService:
             bool: True if conversion successful, False otherwise
         """
         try:
-            workbook = Workbook(excel_path) # type: ignore
-            
-            # Find sheet by name
-            sheet_index = None
-            for i in range(len(workbook.worksheets)): # type: ignore
-                if workbook.worksheets[i].name == sheet_name:
-                    sheet_index = i
-                    break
+            # Find sheet by name before paying for a full load
+            key = self._file_key(excel_path)
+            sheet_index = self._file_sheet_index_map(excel_path, key).get(sheet_name)
             
             if sheet_index is None:
-                logger.error(f"Sheet '{sheet_name}' not found in workbook")
+                logger.error("Sheet '%s' not found in workbook", sheet_name)
                 return False
             
-            return self.convert_excel_to_pdf(
-                excel_path, pdf_path, 
+            workbook = self._load_workbook(excel_path, key)
+            return self._convert_workbook_to_pdf(
+                workbook, pdf_path, 
                 sheet_indices=[sheet_index], 
                 recalculate_formulas=recalculate_formulas,
                 orientation=orientation,
@@ -288,101 +978,328 @@ class ExcelToPdfService:
             )
             
         except Exception as e:
-            logger.error(f"Failed to convert sheet '{sheet_name}' to PDF: {e}")
+            logger.error("Failed to convert sheet '%s' to PDF: %s", sheet_name, e)
             return False
     
-    def batch_convert(self, input_files: List[str], output_dir: str = "output",
-                     orientation: Optional[str] = None,
-                     zoom_scale: Optional[int] = None) -> Dict[str, Any]:
+    def convert_sheets_to_pdfs(self, excel_path: str, sheet_names: List[str],
+                               output_dir: str = "output",
+                               recalculate_formulas: bool = True,
+                               orientation: Optional[str] = None,
+                               zoom_scale: Optional[int] = None) -> Dict[str, Optional[str]]:
         """
-        Convert multiple Excel files to PDF with specified zoom/orientation.
+        Convert several worksheets of one Excel file to separate PDFs.
+        
+        The workbook is loaded and recalculated once; each sheet is then
+        rendered on its own by hiding the others.
         
         Args:
-            input_files: List of Excel file paths
-            output_dir: Output directory for PDF files
+            excel_path: Path to input Excel file
+            sheet_names: Names of the worksheets to convert
+            output_dir: Output directory, PDFs are named "<file>_<sheet>.pdf"
+            recalculate_formulas: Whether to recalculate formulas before export
             orientation: Page orientation ("portrait", "landscape"). If None, uses default.
             zoom_scale: Manual zoom percentage. If None, uses default.
         
         Returns:
-            Dict containing conversion results
+            Dict mapping each sheet name to its PDF path, or None if it failed
         """
-        # Create output directory
+        results: Dict[str, Optional[str]] = {name: None for name in sheet_names}
+        
+        try:
+            workbook = self._load_workbook(excel_path)
+            if recalculate_formulas:
+                self._recalculate(workbook)
+            index_map = self._sheet_index_map(workbook)
+        except Exception as e:
+            logger.error("Failed to load workbook %s: %s", excel_path, e)
+            return results
+        
         output_path = pathlib.Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        stem = pathlib.Path(excel_path).stem
         
-        results = {
-            "successful_conversions": [],
-            "failed_conversions": [],
-            "total_files": len(input_files),
-            "success_count": 0,
-            "failure_count": 0
-        }
-        
-        for file_path in input_files:
-            input_path = pathlib.Path(file_path)
+        for sheet_name in sheet_names:
+            sheet_index = index_map.get(sheet_name)
+            if sheet_index is None:
+                logger.error("Sheet '%s' not found in workbook", sheet_name)
+                continue
             
-            if not input_path.exists():
-                logger.error(f"File not found: {file_path}")
-                results["failed_conversions"].append({
-                    "file": file_path,
-                    "error": "File not found"
-                })
-                results["failure_count"] += 1
+            pdf_path = str(output_path / f"{stem}_{sheet_name}.pdf")
+            if self._convert_workbook_to_pdf(
+                workbook, pdf_path,
+                sheet_indices=[sheet_index],
+                recalculate_formulas=recalculate_formulas,
+                orientation=orientation,
+                zoom_scale=zoom_scale
+            ):
+                results[sheet_name] = pdf_path
+        
+        return results
+    
+    @staticmethod
+    def _validate_batch_inputs(input_files: List[BatchInput]) -> Tuple[
+            List[Tuple[int, str, os.stat_result]], List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Check batch inputs with one stat each, before any workbook is opened.
+        
+        Returns:
+            Tuple of (valid, failures): (index, path, stat) for each convertible
+            file, and (index, failed conversion entry) for the rest
+        """
+        valid = []
+        failures = []
+        for idx, item in enumerate(input_files):
+            # One stat serves the existence check, the cache key and the file size
+            file_path, file_stat = _split_batch_input(item)
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    # Missing, or unreachable (ENOTDIR, EACCES, ELOOP): reported per file
+                    pass
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+                logger.error("File not found: %s", file_path)
+                failures.append((idx, {"file": file_path, "error": "File not found"}))
                 continue
             
             # Check if it's an Excel file
-            if input_path.suffix.lower() not in ['.xlsx', '.xls', '.xlsm']:
-                logger.error(f"Not an Excel file: {file_path}")
-                results["failed_conversions"].append({
-                    "file": file_path,
-                    "error": "Not an Excel file"
-                })
-                results["failure_count"] += 1
+            if os.path.splitext(file_path)[1].lower() not in _EXCEL_EXTENSIONS:
+                logger.error("Not an Excel file: %s", file_path)
+                failures.append((idx, {"file": file_path, "error": "Not an Excel file"}))
                 continue
             
-            # Generate PDF path
-            pdf_filename = f"{input_path.stem}.pdf"
-            pdf_path = output_path / pdf_filename
-            
-            # Get metadata
-            metadata = self.get_excel_metadata(file_path)
-            
+            valid.append((idx, file_path, file_stat))
+        return valid, failures
+    
+    def _convert_batch_file(self, file_path: str, file_stat: os.stat_result, output_dir: str,
+                            orientation: Optional[str] = None,
+                            zoom_scale: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Convert a single batch input file that passed _validate_batch_inputs.
+        
+        Returns:
+            Tuple of (success, result entry) where the entry has the shape used
+            in batch_convert's successful/failed conversion lists
+        """
+        # Generate PDF path
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        pdf_path = os.path.join(output_dir, f"{stem}.pdf")
+        
+        # Load once and share the workbook between metadata and conversion
+        key = self._file_key(file_path, file_stat)
+        if not self._is_spreadsheet(file_path, key):
+            return False, {"file": file_path, "error": "Not an Excel file"}
+        try:
+            workbook = self._load_workbook(file_path, key)
+        except Exception as e:
+            logger.error("Failed to load workbook %s: %s", file_path, e)
+            return False, {"file": file_path, "error": "Conversion failed"}
+        
+        try:
             # Convert to PDF with scaling options
-            success = self.convert_excel_to_pdf(
-                str(input_path), str(pdf_path),
+            success = self._convert_workbook_to_pdf(
+                workbook, pdf_path,
                 orientation=orientation,
                 zoom_scale=zoom_scale
             )
             
+            # Metadata is only reported for converted files
+            metadata = self._metadata_from_workbook(workbook, file_path, file_stat) if success else None
+        finally:
+            # Batch files are not revisited, so don't keep them cached
+            self._release_workbook(key)
+        
+        if not success:
+            return False, {"file": file_path, "error": "Conversion failed"}
+        
+        return True, {
+            "input_file": file_path,
+            "output_file": pdf_path,
+            "metadata": metadata
+        }
+    
+    def iter_batch_convert(self, input_files: List[BatchInput], output_dir: str = "output",
+                           orientation: Optional[str] = None,
+                           zoom_scale: Optional[int] = None,
+                           max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Convert multiple Excel files to PDF, yielding each result as it completes.
+        
+        Files are converted in parallel worker processes, each holding its own
+        ExcelToPdfService, since Aspose conversions are CPU-bound and independent.
+        
+        Args:
+            input_files: List of Excel file paths or os.scandir() entries
+            output_dir: Output directory for PDF files
+            orientation: Page orientation ("portrait", "landscape"). If None, uses default.
+            zoom_scale: Manual zoom percentage. If None, uses default.
+            max_workers: Number of worker processes. If None, uses the service's
+                max_workers, else the CPU count; 1 converts sequentially in the
+                current process.
+        
+        Yields:
+            Per-file result dicts with a "success" flag plus either
+            input_file/output_file/metadata or file/error
+        """
+        for _, success, entry in self._iter_batch_results(
+            input_files, output_dir, orientation, zoom_scale, max_workers
+        ):
+            yield {"success": success, **entry}
+    
+    def _iter_batch_results(self, input_files: List[BatchInput], output_dir: str,
+                            orientation: Optional[str],
+                            zoom_scale: Optional[int],
+                            max_workers: Optional[int]) -> Iterator[Tuple[int, bool, Dict[str, Any]]]:
+        """Yield (input index, success, entry) for each file as it completes."""
+        # Create output directory
+        os.makedirs(output_dir, exist_ok=True)
+        output_dir = os.fspath(output_dir)
+        
+        if max_workers is None:
+            max_workers = self.max_workers
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        
+        # Report bad inputs up front so only real conversions are scheduled
+        valid, failures = self._validate_batch_inputs(input_files)
+        for idx, entry in failures:
+            yield idx, False, entry
+        
+        if workers <= 1 or len(valid) <= 1:
+            # Not worth the process pool start-up cost
+            for idx, file_path, file_stat in valid:
+                success, entry = self._convert_batch_file(
+                    file_path, file_stat, output_dir,
+                    orientation=orientation,
+                    zoom_scale=zoom_scale
+                )
+                yield idx, success, entry
+            return
+        
+        # Each worker starts Aspose, applies the license and builds its service once.
+        # Spawn, not fork: this process already runs the .NET runtime, which
+        # can't be carried into a forked child
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(valid)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._init_kwargs,)
+        )
+        try:
+            # Paths and stat results pickle, unlike the DirEntry objects they may come from
+            futures = {
+                executor.submit(
+                    _convert_one, file_path, file_stat, output_dir,
+                    orientation, zoom_scale
+                ): (idx, file_path)
+                for idx, file_path, file_stat in valid
+            }
+            
+            for future in as_completed(futures):
+                idx, file_path = futures[future]
+                try:
+                    success, entry = future.result()
+                except Exception as e:
+                    logger.error("Worker failed for %s: %s", file_path, e)
+                    success, entry = False, {"file": file_path, "error": str(e)}
+                yield idx, success, entry
+        finally:
+            # Don't start queued files if the caller stops consuming early
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def batch_convert(self, input_files: List[BatchInput], output_dir: str = "output",
+                     orientation: Optional[str] = None,
+                     zoom_scale: Optional[int] = None,
+                     max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert multiple Excel files to PDF with specified zoom/orientation.
+        
+        Collects the results of iter_batch_convert, in input order; see it
+        for the arguments.
+        
+        Returns:
+            Dict containing conversion results
+        """
+        # Results arrive in completion order; slot them by input index so
+        # the returned lists follow input_files regardless of worker timing
+        succeeded: List[Optional[Dict[str, Any]]] = [None] * len(input_files)
+        failed: List[Optional[Dict[str, Any]]] = [None] * len(input_files)
+        
+        for idx, success, entry in self._iter_batch_results(
+            input_files, output_dir, orientation, zoom_scale, max_workers
+        ):
             if success:
-                results["successful_conversions"].append({
-                    "input_file": file_path,
-                    "output_file": str(pdf_path),
-                    "metadata": metadata
-                })
-                results["success_count"] += 1
+                succeeded[idx] = entry
             else:
-                results["failed_conversions"].append({
-                    "file": file_path,
-                    "error": "Conversion failed"
-                })
-                results["failure_count"] += 1
+                failed[idx] = entry
+        
+        successful_conversions = [entry for entry in succeeded if entry is not None]
+        failed_conversions = [entry for entry in failed if entry is not None]
+        
+        results = {
+            "successful_conversions": successful_conversions,
+            "failed_conversions": failed_conversions,
+            "total_files": len(input_files),
+            "success_count": len(successful_conversions),
+            "failure_count": len(failed_conversions)
+        }
         
         return results
 
 
+# Service instance reused by every task a batch worker process runs
+_WORKER_SERVICE: Optional[ExcelToPdfService] = None
+
+
+def _init_worker(service_kwargs: Dict[str, Any]):
+    """Process pool initializer: build the worker's service before its first task."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = ExcelToPdfService(**service_kwargs)
+
+
+def _convert_one(file_path: str, file_stat: os.stat_result, output_dir: str,
+                 orientation: Optional[str], zoom_scale: Optional[int]) -> Tuple[bool, Dict[str, Any]]:
+    """Convert one validated batch file inside a worker process."""
+    return _WORKER_SERVICE._convert_batch_file(
+        file_path, file_stat, output_dir,
+        orientation=orientation,
+        zoom_scale=zoom_scale
+    )
+
+
+def _expand_inputs(paths: List[str]) -> List[BatchInput]:
+    """Replace directory arguments with the Excel files directly inside them."""
+    inputs: List[BatchInput] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            inputs.append(path)
+            continue
+        with os.scandir(path) as entries:
+            inputs.extend(sorted(
+                (entry for entry in entries
+                 if os.path.splitext(entry.name)[1].lower() in _EXCEL_EXTENSIONS
+                 and entry.is_file()),
+                key=lambda entry: entry.name
+            ))
+    return inputs
+
+
 def main():
     """Main function for command-line usage."""
     import argparse
     
     parser = argparse.ArgumentParser(description="Excel to PDF Conversion Service with Zoom and Orientation")
-    parser.add_argument("input", nargs="+", help="Input Excel file(s)")
+    parser.add_argument("input", nargs="+", help="Input Excel file(s) or directories")
     parser.add_argument("-o", "--output", default="temp", help="Output directory (default: temp)")
     parser.add_argument("-s", "--sheet", help="Convert specific sheet by name")
     parser.add_argument("--no-recalc", action="store_true", help="Skip formula recalculation")
     parser.add_argument("--orientation", choices=["portrait", "landscape"], 
                        default="landscape", help="Page orientation (default: landscape)")
     parser.add_argument("--zoom", type=int, default=70, help="Manual zoom percentage (default: 70)")
+    parser.add_argument("--quality", choices=sorted(_QUALITY_PROFILES), default="screen",
+                       help="PDF output profile (default: screen)")
+    parser.add_argument("--license", help="Aspose.Cells license file")
+    parser.add_argument("-j", "--jobs", type=int,
+                       help="Worker processes for batch conversion (default: one per file, up to the CPU count)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     
     args = parser.parse_args()
@@ -393,7 +1310,9 @@ def main():
     try:
         service = ExcelToPdfService(
             default_zoom_scale=args.zoom,
-            default_orientation=args.orientation
+            default_orientation=args.orientation,
+            quality=args.quality,
+            license_path=args.license
         )
         
         if len(args.input) == 1 and args.sheet:
@@ -423,42 +1342,45 @@ def main():
                 
         else:
             # Batch conversion
-            print(f"Converting {len(args.input)} file(s)...")
+            input_files = _expand_inputs(args.input)
+            jobs = args.jobs or min(len(input_files), os.cpu_count() or 1)
+            print(f"Converting {len(input_files)} file(s) with {jobs} worker(s)...")
             print(f"Zoom: {args.zoom}%, orientation: {args.orientation}")
             
-            results = service.batch_convert(
-                args.input, args.output,
+            # Report each file as soon as its worker finishes
+            success_count = 0
+            failure_count = 0
+            for result in service.iter_batch_convert(
+                input_files, args.output,
                 orientation=args.orientation,
-                zoom_scale=args.zoom
-            )
-            
-            print(f"\n📊 Conversion Results:")
-            print(f"Total files: {results['total_files']}")
-            print(f"Successful: {results['success_count']}")
-            print(f"Failed: {results['failure_count']}")
-            
-            if results["successful_conversions"]:
-                print(f"\n✅ Successful conversions:")
-                for conversion in results["successful_conversions"]:
-                    print(f"  {conversion['input_file']} -> {conversion['output_file']}")
-                    metadata = conversion["metadata"]
+                zoom_scale=args.zoom,
+                max_workers=jobs
+            ):
+                if result["success"]:
+                    success_count += 1
+                    print(f"✅ {result['input_file']} -> {result['output_file']}")
+                    metadata = result["metadata"]
                     if metadata.get("sheets_count"):
                         print(f"    Sheets: {metadata['sheets_count']}, Size: {metadata.get('file_size_mb', 'N/A')} MB")
+                else:
+                    failure_count += 1
+                    print(f"❌ {result['file']}: {result['error']}")
             
-            if results["failed_conversions"]:
-                print(f"\n❌ Failed conversions:")
-                for failure in results["failed_conversions"]:
-                    print(f"  {failure['file']}: {failure['error']}")
+            print(f"\n📊 Conversion Results:")
+            print(f"Total files: {len(input_files)}")
+            print(f"Successful: {success_count}")
+            print(f"Failed: {failure_count}")
                     
     except ImportError as e:
         print(f"❌ Missing required dependency: {e}")
         print("Install Aspose.Cells: pip install aspose-cells-python")
     except Exception as e:
         print(f"❌ Error: {e}")
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
  
  
-if __name__ == "__main__":
+def _demo():
+    """Example usage with zoom and landscape orientation on sample input files."""
     # Example usage for your specific case with zoom and landscape orientation
     test_files = [
         "input/input.xlsx",
@@ -478,6 +1400,9 @@ if __name__ == "__main__":
                 print(f"Processing: {file_path}")
                 print(f"{'='*60}")
                 
+                # Load once; both conversions below share this workbook
+                workbook = service.load_workbook(file_path)
+                
                 # Get metadata
                 metadata = service.get_excel_metadata(file_path)
                 print(f"Excel Info:")
@@ -498,8 +1423,8 @@ if __name__ == "__main__":
                 print(f"  - Orientation: Landscape")
                 print(f"  - Reduced margins for better space utilization")
                 
-                success = service.convert_excel_to_pdf(
-                    file_path, str(pdf_path),
+                success = service.convert_workbook(
+                    workbook, str(pdf_path),
                     zoom_scale=70,            # Manual 70% zoom
                     orientation="landscape",  # Force landscape
                     recalculate_formulas=True
@@ -511,6 +1436,17 @@ if __name__ == "__main__":
                     print(f"PDF should now be at 70% zoom and landscape orientation!")
                 else:
                     print("❌ FAILED!")
+                
+                # Same workbook in portrait: no reload, and the first render
+                # already recalculated it
+                portrait_path = pdf_path.with_name(f"{input_path.stem}_portrait.pdf")
+                if service.convert_workbook(workbook, str(portrait_path), orientation="portrait",
+                                            recalculate_formulas=False):
+                    print(f"✅ Portrait PDF saved to: {portrait_path}")
+                else:
+                    print("❌ Portrait conversion FAILED!")
+                
+                workbook.dispose()
                     
             else:
                 print(f"⚠️  File not found: {file_path}")
@@ -519,4 +1455,8 @@ if __name__ == "__main__":
         print(f"❌ Missing required dependency: {e}")
         print("Install Aspose.Cells: pip install aspose-cells-python")
     except Exception as e:
-        print(f"❌ Error: {e}")
\ No newline at end of file
+        print(f"❌ Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
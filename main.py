@@ -554,7 +554,7 @@ Examples:
         try:
             size_mb = pathlib.Path(file).stat().st_size / (1024 * 1024)
             print(f"   {i}. {file} ({size_mb:.2f} MB)")
-        except:
+        except OSError:
             print(f"   {i}. {file} (size unknown)")
     print("-" * 60)
     
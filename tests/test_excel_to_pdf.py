@@ -0,0 +1,115 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_to_pdf
+from excel_to_pdf import ExcelToPdfService
+
+
+class ValidateBatchInputsTest(unittest.TestCase):
+    """_validate_batch_inputs turns every bad input into its own failure entry."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.xlsx = os.path.join(self.tmp.name, "book.xlsx")
+        with open(self.xlsx, "wb"):
+            pass
+
+    def test_valid_input_keeps_its_index_and_stat(self):
+        valid, failures = ExcelToPdfService._validate_batch_inputs([self.xlsx])
+        self.assertEqual(failures, [])
+        self.assertEqual(len(valid), 1)
+        idx, path, file_stat = valid[0]
+        self.assertEqual((idx, path), (0, self.xlsx))
+        self.assertEqual(file_stat.st_size, 0)
+
+    def test_unreachable_paths_are_reported_per_file(self):
+        inputs = [
+            os.path.join(self.tmp.name, "missing.xlsx"),
+            os.path.join(self.xlsx, "child.xlsx"),  # ENOTDIR
+            self.tmp.name,  # a directory
+            self.xlsx,
+        ]
+        valid, failures = ExcelToPdfService._validate_batch_inputs(inputs)
+        self.assertEqual([idx for idx, _, _ in valid], [3])
+        self.assertEqual(
+            failures,
+            [(i, {"file": inputs[i], "error": "File not found"}) for i in range(3)]
+        )
+
+    def test_other_extensions_are_rejected(self):
+        notes = os.path.join(self.tmp.name, "notes.txt")
+        with open(notes, "w"):
+            pass
+        valid, failures = ExcelToPdfService._validate_batch_inputs([notes, self.xlsx])
+        self.assertEqual([idx for idx, _, _ in valid], [1])
+        self.assertEqual(failures, [(0, {"file": notes, "error": "Not an Excel file"})])
+
+    def test_scandir_entries_reuse_their_stat(self):
+        with os.scandir(self.tmp.name) as entries:
+            valid, failures = ExcelToPdfService._validate_batch_inputs(list(entries))
+        self.assertEqual(failures, [])
+        self.assertEqual([path for _, path, _ in valid], [self.xlsx])
+
+
+@unittest.skipUnless(excel_to_pdf.ASPOSE_AVAILABLE, "Aspose.Cells not installed")
+class WorkbookCacheTest(unittest.TestCase):
+    """The workbook cache is keyed by (path, mtime, size) and bounded LRU."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.service = ExcelToPdfService()
+
+    def _save_workbook(self, name: str, value: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        workbook = excel_to_pdf.cells.Workbook()
+        workbook.worksheets[0].cells.get("A1").put_value(value)
+        workbook.save(path)
+        workbook.dispose()
+        return path
+
+    def test_unchanged_file_reuses_the_workbook(self):
+        path = self._save_workbook("a.xlsx", "a")
+        self.assertIs(self.service._load_workbook(path), self.service._load_workbook(path))
+
+    def test_changed_file_is_reloaded(self):
+        path = self._save_workbook("a.xlsx", "a")
+        first = self.service._load_workbook(path)
+        self._save_workbook("a.xlsx", "a longer value")
+        file_stat = os.stat(path)
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(self.service._load_workbook(path), first)
+
+    def test_least_recently_used_workbook_is_evicted(self):
+        size = ExcelToPdfService.WORKBOOK_CACHE_SIZE
+        paths = [self._save_workbook(f"{i}.xlsx", str(i)) for i in range(size + 1)]
+        for path in paths:
+            self.service._load_workbook(path)
+        cached = {key[0] for key in self.service._wb_cache}
+        self.assertEqual(cached, {os.path.abspath(path) for path in paths[1:]})
+        self.assertEqual(len(self.service._workbook_keys), size)
+
+    def test_metadata_copies_do_not_share_the_cached_sheet_list(self):
+        path = self._save_workbook("a.xlsx", "a")
+        self.service.get_excel_metadata(path)["worksheet_names"].append("extra")
+        self.assertNotIn("extra", self.service.get_excel_metadata(path)["worksheet_names"])
+
+    def test_saved_pdf_gets_the_umask_permissions(self):
+        path = self._save_workbook("a.xlsx", "a")
+        pdf_path = os.path.join(self.tmp.name, "a.pdf")
+        old_mask = os.umask(0o027)
+        try:
+            self.assertTrue(self.service.convert_excel_to_pdf(path, pdf_path))
+        finally:
+            os.umask(old_mask)
+        self.assertEqual(os.stat(pdf_path).st_mode & 0o777, 0o640)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["a.pdf", "a.xlsx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_to_pdf
+from text_to_pdf import TextToPdfService
+
+
+class _TextFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.service = TextToPdfService()
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _rewrite(self, path: str, data: bytes):
+        """Replace a file's contents and move its mtime on, as a later edit would."""
+        file_stat = os.stat(path)
+        with open(path, "wb") as f:
+            f.write(data)
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+
+
+@unittest.skipUnless(text_to_pdf.REPORTLAB_AVAILABLE, "ReportLab not installed")
+class IterParagraphsTest(_TextFileTestCase):
+    """iter_paragraphs yields what read_text_file(...).split('\\n\\n') would."""
+
+    def _assert_paragraphs(self, path: str, expected):
+        self.assertEqual(list(self.service.iter_paragraphs(path)), expected)
+        self.assertEqual(self.service.read_text_file(path).split("\n\n"), expected)
+
+    def test_crlf_line_endings_are_normalized(self):
+        path = self._write("crlf.txt", b"one\r\ntwo\r\n\r\nthree\r\n")
+        self._assert_paragraphs(path, ["one\ntwo", "three\n"])
+
+    def test_utf8_text(self):
+        path = self._write("utf8.txt", "Café naïve\n\nrésumé €5\n".encode("utf-8"))
+        self._assert_paragraphs(path, ["Café naïve", "résumé €5\n"])
+
+    def test_utf16_text_with_bom(self):
+        path = self._write("utf16.txt", "Grüße\n\nこんにちは\n".encode("utf-16"))
+        self._assert_paragraphs(path, ["Grüße", "こんにちは\n"])
+
+    def test_utf8_after_a_long_ascii_head(self):
+        # Past the encoding sample, so detection alone would answer ASCII
+        head = "plain ascii line\n" * (TextToPdfService.ENCODING_SAMPLE_SIZE // 16)
+        path = self._write("late.txt", (head + "\nCafé résumé\n").encode("utf-8"))
+        paragraphs = list(self.service.iter_paragraphs(path))
+        self.assertEqual(paragraphs[-1], "Café résumé\n")
+        self.assertNotIn("�", paragraphs[-1])
+
+    def test_undecodable_bytes_are_replaced_not_dropped(self):
+        path = self._write("bad.txt", b"ok\n\n\xff\xfe\xfa broken\n" * 3)
+        paragraphs = list(self.service.iter_paragraphs(path))
+        self.assertEqual(paragraphs, self.service.read_text_file(path).split("\n\n"))
+        self.assertEqual(len(paragraphs), 4)
+        self.assertIn("broken", paragraphs[1])
+
+
+@unittest.skipUnless(text_to_pdf.REPORTLAB_AVAILABLE, "ReportLab not installed")
+class TextCacheTest(_TextFileTestCase):
+    """Encodings and decoded text are cached by (path, mtime, size) in bounded LRUs."""
+
+    def test_rewritten_file_is_read_again(self):
+        path = self._write("a.txt", b"first\n")
+        self.assertEqual(self.service.read_text_file(path), "first\n")
+        self._rewrite(path, b"second version\n")
+        self.assertEqual(self.service.read_text_file(path), "second version\n")
+        self.assertEqual(list(self.service.iter_paragraphs(path)), ["second version\n"])
+
+    def test_same_size_rewrite_is_read_again(self):
+        path = self._write("a.txt", b"aaaa\n")
+        self.assertEqual(self.service.read_text_file(path), "aaaa\n")
+        self._rewrite(path, b"bbbb\n")
+        self.assertEqual(self.service.read_text_file(path), "bbbb\n")
+
+    def test_encoding_cache_evicts_least_recently_used(self):
+        self.service.ENCODING_CACHE_SIZE = 2
+        paths = [self._write(f"{i}.txt", f"file {i}\n".encode()) for i in range(3)]
+        for path in paths[:2]:
+            self.service.detect_encoding(path)
+        self.service.detect_encoding(paths[0])  # now the most recently used
+        self.service.detect_encoding(paths[2])
+        cached = {key[0] for key in self.service._encoding_cache}
+        self.assertEqual(cached, {os.path.abspath(paths[0]), os.path.abspath(paths[2])})
+
+    def test_content_cache_is_bounded_by_file_size(self):
+        self.service.CONTENT_CACHE_BYTES = 20
+        paths = [self._write(f"{i}.txt", b"x" * 9 + b"\n") for i in range(3)]
+        for path in paths:
+            self.service.read_text_file(path)
+        self.assertLessEqual(self.service._content_cache_bytes, 20)
+        cached = {key[0] for key in self.service._content_cache}
+        self.assertEqual(cached, {os.path.abspath(path) for path in paths[1:]})
+
+
+@unittest.skipUnless(text_to_pdf.REPORTLAB_AVAILABLE, "ReportLab not installed")
+class WritePdfTest(_TextFileTestCase):
+    """PDFs are moved into place atomically with the permissions open() would give."""
+
+    def setUp(self):
+        super().setUp()
+        self.old_mask = os.umask(0o027)
+        self.addCleanup(os.umask, self.old_mask)
+
+    def test_written_pdf_gets_the_umask_permissions(self):
+        pdf_path = os.path.join(self.tmp.name, "out.pdf")
+        TextToPdfService._write_pdf(pdf_path, b"%PDF-1.4\n")
+        self.assertEqual(os.stat(pdf_path).st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.tmp.name), ["out.pdf"])
+
+    def test_converted_pdf_gets_the_umask_permissions(self):
+        path = self._write("a.txt", b"Hello\n\nworld\n")
+        pdf_path = os.path.join(self.tmp.name, "a.pdf")
+        self.assertTrue(self.service.convert_text_to_pdf(path, pdf_path))
+        self.assertEqual(os.stat(pdf_path).st_mode & 0o777, 0o640)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["a.pdf", "a.txt"])
+
+    def test_failed_write_keeps_the_old_pdf(self):
+        pdf_path = self._write("out.pdf", b"old")
+        with self.assertRaises(TypeError):
+            TextToPdfService._write_pdf(pdf_path, "not bytes")
+        with open(pdf_path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(self.tmp.name), ["out.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
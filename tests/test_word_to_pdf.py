@@ -0,0 +1,122 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import word_to_pdf
+
+try:
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import Inches
+except ImportError:
+    Document = None
+
+
+@unittest.skipUnless(Document, "python-docx not installed")
+class ParagraphsTextTest(unittest.TestCase):
+    """_paragraphs_text must read the same text as python-docx's .text properties."""
+
+    def setUp(self):
+        self.doc = Document()
+        self.cell = self.doc.add_table(rows=1, cols=1).cell(0, 0)
+
+    def test_tab_stops_are_not_text(self):
+        para = self.cell.paragraphs[0]
+        para.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+        para.add_run("Hello")
+        self.assertEqual(self.cell.text, "Hello")
+        self.assertEqual(word_to_pdf._paragraphs_text(self.cell._tc), self.cell.text)
+
+    def test_run_content_and_breaks(self):
+        para = self.cell.paragraphs[0]
+        run = para.add_run("a")
+        run.add_tab()
+        run.add_text("b")
+        run.add_break()
+        run.add_text("c")
+        run.add_break(WD_BREAK.PAGE)
+        run.add_text("d")
+        self.cell.add_paragraph("second")
+        self.assertEqual(word_to_pdf._paragraphs_text(self.cell._tc), self.cell.text)
+
+    def test_hyperlink_runs_and_nested_text_box(self):
+        para = self.cell.paragraphs[0]
+        para._p.append(parse_xml(
+            f'<w:hyperlink {nsdecls("w", "r")} r:id="rId9">'
+            '<w:r><w:t>link</w:t></w:r></w:hyperlink>'
+        ))
+        # Text inside a text box is nested below the run, not run content
+        para._p.append(parse_xml(
+            f'<w:r {nsdecls("w")}><w:t>x</w:t><w:pict><w:txbxContent>'
+            '<w:p><w:r><w:t>boxed</w:t></w:r></w:p>'
+            '</w:txbxContent></w:pict></w:r>'
+        ))
+        self.assertEqual(word_to_pdf._paragraphs_text(self.cell._tc), self.cell.text)
+
+    def test_body_text_matches_paragraphs(self):
+        self.doc.add_paragraph("one two").paragraph_format.tab_stops.add_tab_stop(Inches(2))
+        self.doc.add_paragraph("three")
+        expected = "\n".join(p.text for p in self.doc.paragraphs)
+        self.assertEqual(word_to_pdf._paragraphs_text(self.doc.element.body), expected)
+
+
+@unittest.skipUnless(Document and word_to_pdf.REPORTLAB_AVAILABLE, "python-docx or ReportLab not installed")
+class DocCacheTest(unittest.TestCase):
+    """_open_doc reuses parses by (path, mtime, size), least recently used evicted first."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.service = word_to_pdf.WordToPdfService()
+
+    def _save(self, name, *texts):
+        path = os.path.join(self.tmp.name, name)
+        doc = Document()
+        for text in texts:
+            doc.add_paragraph(text)
+        doc.save(path)
+        return path
+
+    def test_unchanged_file_reuses_the_parse(self):
+        path = self._save("a.docx", "one")
+        self.assertIs(self.service._open_doc(path), self.service._open_doc(path))
+
+    def test_changed_file_is_parsed_again(self):
+        path = self._save("a.docx", "one")
+        first = self.service._open_doc(path)
+        file_stat = os.stat(path)
+        self._save("a.docx", "one", "two")
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+        second = self.service._open_doc(path)
+        self.assertIsNot(second, first)
+        self.assertEqual([p.text for p in second.paragraphs], ["one", "two"])
+
+    def test_least_recently_used_doc_is_evicted(self):
+        self.service.DOC_CACHE_SIZE = 2
+        paths = [self._save(f"{i}.docx", str(i)) for i in range(3)]
+        self.service._open_doc(paths[0])
+        self.service._open_doc(paths[1])
+        self.service._open_doc(paths[0])  # now the most recently used
+        self.service._open_doc(paths[2])
+        cached = {key[0] for key in self.service._doc_cache}
+        self.assertEqual(cached, {os.path.abspath(paths[0]), os.path.abspath(paths[2])})
+
+    def test_converted_pdf_gets_the_umask_permissions(self):
+        path = self._save("a.docx", "Hello")
+        pdf_path = os.path.join(self.tmp.name, "a.pdf")
+        old_mask = os.umask(0o027)
+        try:
+            self.assertTrue(self.service.convert_word_to_pdf(path, pdf_path))
+        finally:
+            os.umask(old_mask)
+        self.assertEqual(os.stat(pdf_path).st_mode & 0o777, 0o640)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["a.docx", "a.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
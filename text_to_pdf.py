@@ -1,12 +1,22 @@
+import io
 import os
+import codecs
+import re
+import mmap
 import pathlib
 import logging
 import sys
-from typing import Optional, Dict, Any, List
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
+
+from atomic_write import atomic_output
 
 # PDF creation dependencies
 try:
     import chardet
+    from chardet.universaldetector import UniversalDetector
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Preformatted, Spacer
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -18,6 +28,7 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     logging.warning("ReportLab not available. Install: pip install reportlab")
     chardet = None
+    UniversalDetector = None
     # Create proper mock classes with required methods
     class _SimpleDocTemplate:
         def __init__(self, filename, **kwargs): pass
@@ -47,6 +58,23 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Runs of non-whitespace, i.e. what str.split() would return as words
+_WORD_RE = re.compile(r'\S+')
+
+# Candidate CSV delimiters, in tie-break order
+_CSV_DELIMITERS = (',', ';', '\t', '|')
+
+# Byte order marks of encodings whose text is legitimately full of NUL bytes
+_WIDE_BOMS = (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+# Tried after the detected encoding when that one can't decode the whole file
+_FALLBACK_ENCODING = 'utf-8'
+
+# Markdown heading: leading '#' run and the text after it
+_MD_HEADING = re.compile(r'(#+)\s*(.*)', re.S)
+# Style per heading level; deeper levels all render as Heading3
+_HEADING_STYLE_KEYS = ('Heading1', 'Heading2', 'Heading3')
+
 
 class TextToPdfService:
     """
@@ -54,6 +82,17 @@ class TextToPdfService:
     Note: This is mainly for edge cases - Gemini can process text files natively.
     """
     
+    # Most bytes fed to chardet; detection usually settles long before this
+    ENCODING_SAMPLE_SIZE = 256 * 1024
+    # Chunk size for chardet's incremental detector
+    DETECT_CHUNK_SIZE = 64 * 1024
+    # Number of detected encodings remembered per service instance
+    ENCODING_CACHE_SIZE = 256
+    # Total size of the files whose decoded text is kept for reuse
+    CONTENT_CACHE_BYTES = 64 * 1024 * 1024
+    # Leading bytes checked for NULs before a file is treated as text
+    BINARY_SAMPLE_SIZE = 4096
+    
     def __init__(self):
         """Initialize the Text to PDF service."""
         if not REPORTLAB_AVAILABLE:
@@ -63,31 +102,277 @@ class TextToPdfService:
             )
         
         self.supported_formats = {'.txt', '.csv', '.tsv', '.json', '.xml', '.html', '.md', '.rtf'}
+        
+        # Built once: the sample sheet is the same for every file, and
+        # building a document only reads the styles, so sharing them is safe
+        self._styles = getSampleStyleSheet()
+        self._styles.add(ParagraphStyle(
+            'TextNormal',
+            parent=self._styles['Normal'],
+            fontSize=10,
+            leading=14,
+            spaceAfter=6,
+            fontName='Courier'  # Monospace for better text formatting
+        ))
+        
+        # Detected encodings keyed by (path, mtime, size), shared by metadata and conversion
+        self._encoding_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        # (encoding, errors) checked against the whole file, by the same key
+        self._decoding_cache: "OrderedDict[Tuple[str, int, int], Tuple[str, str]]" = OrderedDict()
+        # Decoded (text, encoding) by the same key, so metadata and conversion
+        # of one file decode it once; bounded by CONTENT_CACHE_BYTES of file size
+        self._content_cache: "OrderedDict[Tuple[str, int, int], Tuple[str, str]]" = OrderedDict()
+        self._content_cache_bytes = 0
+    
+    @staticmethod
+    def _file_key(file_path: str) -> Tuple[str, int, int]:
+        """Cheap identity of a file's current contents: (path, mtime_ns, size)."""
+        file_stat = os.stat(file_path)
+        return (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def _detect_from_chunks(self, chunks: Iterable[bytes]) -> str:
+        """Feed chardet's incremental detector until it is confident or the sample ends."""
+        if UniversalDetector is None:
+            return 'utf-8'
+        detector = UniversalDetector()
+        fed = 0
+        for chunk in chunks:
+            detector.feed(chunk)
+            fed += len(chunk)
+            if detector.done or fed >= self.ENCODING_SAMPLE_SIZE:
+                break
+        detector.close()
+        return detector.result.get('encoding') or 'utf-8'
+    
+    def _cached_encoding(self, key: Tuple[str, int, int],
+                         read_chunks: Callable[[], Iterable[bytes]]) -> str:
+        """Return the encoding for key, detecting it from read_chunks() on a cache miss."""
+        encoding = self._encoding_cache.get(key)
+        if encoding is not None:
+            self._encoding_cache.move_to_end(key)
+            return encoding
+        
+        encoding = self._detect_from_chunks(read_chunks())
+        self._remember_encoding(key, encoding)
+        return encoding
+    
+    def _remember_encoding(self, key: Tuple[str, int, int], encoding: str):
+        """Store a detected encoding, evicting the least recently used entries."""
+        self._encoding_cache[key] = encoding
+        while len(self._encoding_cache) > self.ENCODING_CACHE_SIZE:
+            self._encoding_cache.popitem(last=False)
+    
+    def _cached_content(self, key: Tuple[str, int, int]) -> Optional[Tuple[str, str]]:
+        """Return the cached (text, encoding) for key, or None."""
+        entry = self._content_cache.get(key)
+        if entry is not None:
+            self._content_cache.move_to_end(key)
+        return entry
+    
+    def _remember_content(self, key: Tuple[str, int, int], content: str, encoding: str):
+        """Cache decoded text, evicting the oldest entries past CONTENT_CACHE_BYTES."""
+        size = key[2]
+        if size > self.CONTENT_CACHE_BYTES or key in self._content_cache:
+            return
+        self._content_cache[key] = (content, encoding)
+        self._content_cache_bytes += size
+        while self._content_cache_bytes > self.CONTENT_CACHE_BYTES:
+            old_key, _ = self._content_cache.popitem(last=False)
+            self._content_cache_bytes -= old_key[2]
+    
+    def _mmap_chunks(self, mm: mmap.mmap) -> Iterator[bytes]:
+        """Slice a mapping into DETECT_CHUNK_SIZE pieces for encoding detection."""
+        chunk_size = self.DETECT_CHUNK_SIZE
+        return (mm[i:i + chunk_size] for i in range(0, len(mm), chunk_size))
+    
+    def _mmap_encoding(self, key: Tuple[str, int, int], mm: mmap.mmap) -> str:
+        """Encoding of a mapped file, skipping chardet when every byte is ASCII."""
+        if key not in self._encoding_cache:
+            if all(chunk.isascii() for chunk in self._mmap_chunks(mm)):
+                # A C-level scan of the whole file beats chardet's pure-Python
+                # probers over the sample, and ASCII is what chardet would answer
+                self._remember_encoding(key, 'ascii')
+            else:
+                encoding = self._cached_encoding(key, lambda: self._mmap_chunks(mm))
+                if encoding == 'ascii':
+                    # Only the sample was ASCII; the scan just found high bytes
+                    encoding = _FALLBACK_ENCODING
+                    self._remember_encoding(key, encoding)
+                return encoding
+        return self._cached_encoding(key, lambda: self._mmap_chunks(mm))
+    
+    def _candidate_encodings(self, key: Tuple[str, int, int], mm: mmap.mmap) -> List[str]:
+        """Encodings to try strictly on a mapped file: the detected one, then the fallback."""
+        detected = self._mmap_encoding(key, mm)
+        try:
+            if codecs.lookup(detected).name == _FALLBACK_ENCODING:
+                return [detected]
+        except LookupError:
+            return [_FALLBACK_ENCODING]
+        return [detected, _FALLBACK_ENCODING]
+    
+    def _cached_decoding(self, key: Tuple[str, int, int]) -> Optional[Tuple[str, str]]:
+        """Return the settled (encoding, errors) for key, or None."""
+        decoding = self._decoding_cache.get(key)
+        if decoding is not None:
+            self._decoding_cache.move_to_end(key)
+        return decoding
+    
+    def _remember_decoding(self, key: Tuple[str, int, int], encoding: str,
+                           errors: str) -> Tuple[str, str]:
+        """Record how a whole file decodes; detect_encoding then reports the same encoding."""
+        self._decoding_cache[key] = (encoding, errors)
+        while len(self._decoding_cache) > self.ENCODING_CACHE_SIZE:
+            self._decoding_cache.popitem(last=False)
+        self._remember_encoding(key, encoding)
+        return encoding, errors
+    
+    def _lossy_decoding(self, key: Tuple[str, int, int], candidates: List[str]) -> Tuple[str, str]:
+        """Last resort when no candidate decodes strictly: replace the undecodable bytes."""
+        logger.warning(
+            f"{key[0]} is not valid {' or '.join(candidates)}; "
+            f"undecodable bytes will be replaced"
+        )
+        return self._remember_decoding(key, candidates[0], 'replace')
+    
+    def _decodes_strictly(self, mm: mmap.mmap, encoding: str) -> bool:
+        """True if the whole mapping decodes under encoding, checked chunk by chunk."""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            for chunk in self._mmap_chunks(mm):
+                decoder.decode(chunk)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+    
+    def _mapped_decoding(self, key: Tuple[str, int, int], mm: mmap.mmap) -> Tuple[str, str]:
+        """(encoding, errors) for a mapped file, verified without building its text."""
+        decoding = self._cached_decoding(key)
+        if decoding is not None:
+            return decoding
+        candidates = self._candidate_encodings(key, mm)
+        for encoding in candidates:
+            if self._decodes_strictly(mm, encoding):
+                return self._remember_decoding(key, encoding, 'strict')
+        return self._lossy_decoding(key, candidates)
+    
+    def _decode_mapped(self, key: Tuple[str, int, int], mm: mmap.mmap) -> Tuple[str, str]:
+        """Decode a whole mapped file strictly if any candidate allows it: (text, encoding)."""
+        data = mm[:]
+        decoding = self._cached_decoding(key)
+        if decoding is not None:
+            return data.decode(*decoding), decoding[0]
+        candidates = self._candidate_encodings(key, mm)
+        for encoding in candidates:
+            try:
+                content = data.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+            self._remember_decoding(key, encoding, 'strict')
+            return content, encoding
+        encoding, errors = self._lossy_decoding(key, candidates)
+        return data.decode(encoding, errors), encoding
+    
+    @staticmethod
+    def _splits_on_bytes(encoding: str) -> bool:
+        """True if b'\\n\\n' in the raw bytes marks exactly the '\\n\\n' in the decoded text."""
+        try:
+            # Rules out UTF-16/32; ASCII-compatible codecs never use 0x0A inside a multibyte char
+            return '\n\n'.encode(encoding) == b'\n\n'
+        except LookupError:
+            return False
+    
+    @staticmethod
+    def _iter_mmap_paragraphs(mm: mmap.mmap, encoding: str, errors: str) -> Iterator[str]:
+        """Yield the text between b'\\n\\n' boundaries, decoding one slice at a time."""
+        start = 0
+        size = len(mm)
+        while True:
+            end = mm.find(b'\n\n', start)
+            yield mm[start:end if end != -1 else size].decode(encoding, errors)
+            if end == -1:
+                break
+            start = end + 2
+    
+    def iter_paragraphs(self, file_path: str) -> Iterator[str]:
+        """
+        Yield the file's text split on blank lines, as read_text_file(...).split('\\n\\n') would.
+        
+        ASCII-compatible files without carriage returns are scanned in place
+        through an mmap, so the whole text is never decoded at once; anything
+        else falls back to a full read.
+        
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = self._file_key(file_path)
+        cached = self._cached_content(key)
+        if cached is not None:
+            yield from cached[0].split('\n\n')
+            return
+        if key[2]:
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                encoding, errors = self._mapped_decoding(key, mm)
+                # \r needs newline normalization first, so it takes the full-read path
+                if self._splits_on_bytes(encoding) and mm.find(b'\r') == -1:
+                    yield from self._iter_mmap_paragraphs(mm, encoding, errors)
+                    return
+        
+        content = self.read_text_file(file_path)
+        if content is None:
+            raise OSError(f"Could not read {file_path}")
+        yield from content.split('\n\n')
+    
+    def _looks_binary(self, file_path: str) -> bool:
+        """True if more than 10% of the file's leading bytes are NUL (and it has no UTF-16/32 BOM)."""
+        with open(file_path, 'rb') as f:
+            sample = f.read(self.BINARY_SAMPLE_SIZE)
+        if sample.startswith(_WIDE_BOMS):
+            return False
+        return sample.count(b'\x00') * 10 > len(sample)
     
     def detect_encoding(self, file_path: str) -> str:
         """Detect file encoding."""
         try:
+            key = self._file_key(file_path)
             with open(file_path, 'rb') as f:
-                raw_data = f.read()
-                if chardet and hasattr(chardet, 'detect'):
-                    result = chardet.detect(raw_data)
-                    return result.get('encoding', 'utf-8') or 'utf-8'
-                else:
-                    return 'utf-8'
+                return self._cached_encoding(
+                    key, lambda: iter(lambda: f.read(self.DETECT_CHUNK_SIZE), b'')
+                )
         except Exception as e:
             logger.warning(f"Could not detect encoding for {file_path}: {e}")
             return 'utf-8'
     
     def read_text_file(self, file_path: str) -> Optional[str]:
         """Read text file with encoding detection."""
+        return self._read_with_encoding(file_path)[0]
+    
+    def _read_with_encoding(self, file_path: str) -> Tuple[Optional[str], str]:
+        """Read and decode a file in one pass, returning (text or None, encoding)."""
+        encoding = 'utf-8'
         try:
-            encoding = self.detect_encoding(file_path)
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            return content
+            key = self._file_key(file_path)
+            cached = self._cached_content(key)
+            if cached is not None:
+                return cached
+            with open(file_path, 'rb') as f:
+                if key[2] == 0:
+                    # mmap can't map an empty file
+                    return "", encoding
+                # Map the file once: the sample for detection and the bytes to
+                # decode come from the same mapping, with no second read pass
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content, encoding = self._decode_mapped(key, mm)
+            # Match text-mode reads, which translate \r\n and \r to \n
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            self._remember_content(key, content, encoding)
+            return content, encoding
         except Exception as e:
             logger.error(f"Failed to read text file {file_path}: {e}")
-            return None
+            return None, encoding
     
     def convert_text_to_pdf(self, text_path: str, pdf_path: str, 
                            title: Optional[str] = None) -> bool:
@@ -105,14 +390,17 @@ class TextToPdfService:
         try:
             logger.info(f"Converting text to PDF: {text_path} -> {pdf_path}")
             
-            # Read text content
-            content = self.read_text_file(text_path)
-            if content is None:
+            # Empty files get a title-only page; binary files would only
+            # decode to replacement characters, so they are not rendered
+            is_empty = os.stat(text_path).st_size == 0
+            if not is_empty and self._looks_binary(text_path):
+                logger.warning(f"Skipping binary file: {text_path}")
                 return False
             
-            # Create PDF document
+            # Create PDF document; it is built in memory and written out in one go
+            pdf_buffer = io.BytesIO()
             pdf_doc = SimpleDocTemplate(
-                pdf_path,
+                pdf_buffer,
                 pagesize=A4,
                 rightMargin=50,
                 leftMargin=50,
@@ -121,17 +409,7 @@ class TextToPdfService:
             )
             
             story = []
-            styles = getSampleStyleSheet()
-            
-            # Add custom styles
-            styles.add(ParagraphStyle(
-                'TextNormal',
-                parent=styles['Normal'],
-                fontSize=10,
-                leading=14,
-                spaceAfter=6,
-                fontName='Courier'  # Monospace for better text formatting
-            ))
+            styles = self._styles
             
             # Add title
             doc_title = title or pathlib.Path(text_path).stem
@@ -141,40 +419,49 @@ class TextToPdfService:
             # Process content based on file type
             file_extension = pathlib.Path(text_path).suffix.lower()
             
-            if file_extension in ['.json', '.xml']:
+            if is_empty:
+                pass  # Nothing to render past the title
+            elif file_extension in ['.json', '.xml']:
                 # Format structured data
+                content = self.read_text_file(text_path)
+                if content is None:
+                    return False
                 story.append(Preformatted(content, styles['Code']))
             else:
-                # Regular text processing
-                paragraphs = content.split('\n\n')  # Split on double newlines
+                # Regular text processing, one paragraph decoded at a time.
+                # Styles and story.append are bound once, outside the loop
+                append = story.append
+                normal = styles['TextNormal']
+                paragraphs = self.iter_paragraphs(text_path)
                 
-                for para in paragraphs:
-                    para = para.strip()
-                    if not para:
-                        story.append(Spacer(1, 6))
-                        continue
-                    
-                    # Handle different content types
-                    if file_extension == '.md':
-                        # Basic Markdown processing
-                        if para.startswith('#'):
-                            # Heading
-                            level = len(para) - len(para.lstrip('#'))
-                            heading_text = para.lstrip('#').strip()
-                            if level == 1:
-                                story.append(Paragraph(heading_text, styles['Heading1']))
-                            elif level == 2:
-                                story.append(Paragraph(heading_text, styles['Heading2']))
-                            else:
-                                story.append(Paragraph(heading_text, styles['Heading3']))
+                if file_extension == '.md':
+                    # Basic Markdown processing
+                    heading_styles = tuple(styles[key] for key in _HEADING_STYLE_KEYS)
+                    max_level = len(heading_styles)
+                    match_heading = _MD_HEADING.match
+                    for para in paragraphs:
+                        para = para.strip()
+                        if not para:
+                            append(Spacer(1, 6))
+                            continue
+                        heading = match_heading(para)
+                        if heading:
+                            level = min(len(heading.group(1)), max_level)
+                            append(Paragraph(heading.group(2), heading_styles[level - 1]))
                         else:
-                            story.append(Paragraph(para, styles['TextNormal']))
-                    else:
-                        # Regular text
-                        story.append(Paragraph(para, styles['TextNormal']))
+                            append(Paragraph(para, normal))
+                else:
+                    # Regular text
+                    for para in paragraphs:
+                        para = para.strip()
+                        if not para:
+                            append(Spacer(1, 6))
+                            continue
+                        append(Paragraph(para, normal))
             
             # Build PDF
             pdf_doc.build(story)
+            self._write_pdf(pdf_path, pdf_buffer.getbuffer())
             
             logger.info(f"Successfully converted text to PDF: {pdf_path}")
             return True
@@ -183,46 +470,60 @@ class TextToPdfService:
             logger.error(f"Failed to convert text to PDF: {e}")
             return False
     
-    def get_text_metadata(self, text_path: str) -> Dict[str, Any]:
-        """Extract metadata from text file."""
+    @staticmethod
+    def _write_pdf(pdf_path: str, data) -> None:
+        """Write the finished PDF to a temp file with one write, then move it into place."""
+        # Larger than the buffer, so BufferedWriter hands it straight to write(2)
+        with atomic_output(pdf_path) as out:
+            out.write(data)
+    
+    def get_text_metadata(self, text_path: str, content: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from text file.
+        
+        Args:
+            text_path: Path to input text file
+            content: The file's text, if the caller has already read it
+        
+        Returns:
+            Dict of file metadata, or {"error": ...} on failure
+        """
         try:
             file_stat = os.stat(text_path)
             file_size_mb = file_stat.st_size / (1024 * 1024)
             
-            content = self.read_text_file(text_path)
+            if content is None:
+                # One pass yields both the text and the encoding it was decoded with
+                content, encoding = self._read_with_encoding(text_path)
+            else:
+                encoding = self.detect_encoding(text_path)
             
             metadata = {
                 "file_size_mb": round(file_size_mb, 3),
                 "file_format": pathlib.Path(text_path).suffix.lower(),
-                "encoding": self.detect_encoding(text_path)
+                "encoding": encoding
             }
             
             if content:
-                lines = content.split('\n')
-                words = content.split()
-                
+                # Count without building lists of every line and word
                 metadata.update({
-                    "line_count": len(lines),
-                    "word_count": len(words),
+                    "line_count": content.count('\n') + 1,
+                    "word_count": sum(1 for _ in _WORD_RE.finditer(content)),
                     "character_count": len(content)
                 })
                 
                 # Detect content type
                 if pathlib.Path(text_path).suffix.lower() == '.csv':
                     # CSV analysis
-                    if lines:
-                        first_line = lines[0]
-                        delimiter_count = {
-                            ',': first_line.count(','),
-                            ';': first_line.count(';'),
-                            '\t': first_line.count('\t'),
-                            '|': first_line.count('|')
-                        }
-                        likely_delimiter = max(delimiter_count.items(), key=lambda x: x[1])[0]
-                        metadata.update({
-                            "csv_columns": delimiter_count[likely_delimiter] + 1,
-                            "csv_delimiter": likely_delimiter
-                        })
+                    first_line = content.partition('\n')[0]
+                    delimiter_count = {
+                        delimiter: first_line.count(delimiter) for delimiter in _CSV_DELIMITERS
+                    }
+                    likely_delimiter = max(delimiter_count, key=delimiter_count.get)
+                    metadata.update({
+                        "csv_columns": delimiter_count[likely_delimiter] + 1,
+                        "csv_delimiter": likely_delimiter
+                    })
             
             return metadata
             
@@ -231,14 +532,32 @@ class TextToPdfService:
             return {"error": str(e)}
 
 
+# Service instance reused by every file a CLI worker process converts
+_WORKER_SERVICE: Optional[TextToPdfService] = None
+
+
+def _init_worker():
+    """Process pool initializer: build the worker's service before its first file."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = TextToPdfService()
+
+
+def _convert_one(text_path: str, pdf_path: str, title: Optional[str]) -> bool:
+    """Convert one file inside a worker process."""
+    return _WORKER_SERVICE.convert_text_to_pdf(text_path, pdf_path, title=title)
+
+
 if __name__ == "__main__":
     """Command-line interface for text to PDF conversion."""
     import argparse
     
     parser = argparse.ArgumentParser(description="Text to PDF Conversion Service")
-    parser.add_argument("input", help="Input text file")
-    parser.add_argument("-o", "--output", help="Output PDF file")
+    parser.add_argument("input", nargs="+", help="Input text file(s)")
+    parser.add_argument("-o", "--output",
+                        help="Output PDF file, or output directory when given several inputs")
     parser.add_argument("--title", help="Custom document title")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="Worker processes for several inputs (default: one per file, up to the CPU count)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     
     args = parser.parse_args()
@@ -249,31 +568,70 @@ if __name__ == "__main__":
     try:
         service = TextToPdfService()
         
-        input_path = pathlib.Path(args.input)
-        if not input_path.exists():
-            print(f"❌ File not found: {args.input}")
+        missing = [name for name in args.input if not pathlib.Path(name).exists()]
+        if missing:
+            for name in missing:
+                print(f"❌ File not found: {name}")
             sys.exit(1)
         
-        # Determine output path
-        if args.output:
-            output_path = args.output
-        else:
-            output_path = f"{input_path.stem}.pdf"
-        
-        print(f"Converting: {args.input} -> {output_path}")
-        
-        success = service.convert_text_to_pdf(
-            args.input, output_path, title=args.title
-        )
-        
-        if success:
-            print(f"✅ Success: {output_path}")
+        if len(args.input) == 1:
+            input_path = pathlib.Path(args.input[0])
+            
+            # Determine output path
+            if args.output:
+                output_path = args.output
+            else:
+                output_path = f"{input_path.stem}.pdf"
+            
+            print(f"Converting: {args.input[0]} -> {output_path}")
+            
+            success = service.convert_text_to_pdf(
+                args.input[0], output_path, title=args.title
+            )
+            
+            if success:
+                print(f"✅ Success: {output_path}")
+            else:
+                print("❌ Conversion failed")
         else:
-            print("❌ Conversion failed")
+            output_dir = pathlib.Path(args.output or ".")
+            output_dir.mkdir(parents=True, exist_ok=True)
+            jobs = args.jobs or min(len(args.input), os.cpu_count() or 1)
+            print(f"Converting {len(args.input)} file(s) with {jobs} worker(s)...")
+            
+            # ReportLab build is pure-Python CPU work, so files go to separate
+            # processes; spawn gives each a clean interpreter on every platform
+            failure_count = 0
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _convert_one, name,
+                        str(output_dir / f"{pathlib.Path(name).stem}.pdf"), args.title
+                    ): name
+                    for name in args.input
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker failed for {name}: {e}")
+                        success = False
+                    if success:
+                        print(f"✅ {name}")
+                    else:
+                        failure_count += 1
+                        print(f"❌ {name}")
+            
+            print(f"Converted {len(args.input) - failure_count}/{len(args.input)} file(s)")
             
     except ImportError as e:
         print(f"❌ Missing dependency: {e}")
         print("Install required package: pip install reportlab chardet")
     except Exception as e:
         print(f"❌ Error: {e}")
-        logger.error(f"Unexpected error: {e}", exc_info=True)
\ No newline at end of file
+        logger.error(f"Unexpected error: {e}", exc_info=True)
@@ -1,7 +1,14 @@
+import io
 import os
+import re
 import pathlib
 import logging
-from typing import Optional, Dict, Any, List
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+from atomic_write import atomic_output
 
 # Word document processing dependencies
 try:
@@ -69,6 +76,76 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WordprocessingML namespace, in lxml's Clark notation, and the body tags we render
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = f'{_W_NS}p'
+_W_TBL = f'{_W_NS}tbl'
+# A paragraph's explicit style reference, relative to its w:p
+_W_PSTYLE_PATH = f'{_W_NS}pPr/{_W_NS}pStyle'
+
+# Run content python-docx's Paragraph.text reads: only runs directly in the
+# paragraph or in its hyperlinks, so pPr tab stops, text boxes and other
+# nested content are left out
+_RUN_CONTENT_TAGS = ('t', 'tab', 'br', 'cr', 'noBreakHyphen', 'ptab')
+# Child paragraphs and their run content, in document order; python-docx's
+# xpath() supplies the w: prefix
+_PARAGRAPHS_TEXT_XPATH = ' | '.join(['./w:p'] + [
+    f'./w:p/{container}w:r/w:{tag}'
+    for container in ('', 'w:hyperlink/')
+    for tag in _RUN_CONTENT_TAGS
+])
+_W_T = f'{_W_NS}t'
+_W_BR = f'{_W_NS}br'
+_W_BR_TYPE = f'{_W_NS}type'
+# What python-docx's .text renders for the other elements the XPath returns
+_ELEMENT_TEXT = {
+    _W_P: '\n',
+    f'{_W_NS}tab': '\t',
+    f'{_W_NS}ptab': '\t',
+    f'{_W_NS}cr': '\n',
+    f'{_W_NS}noBreakHyphen': '-',
+}
+
+# Runs of non-whitespace, i.e. what str.split() would return as words
+_WORD_RE = re.compile(r'\S+')
+
+def _paragraphs_text(element) -> str:
+    """
+    Text of element's child paragraphs, one line each, like python-docx's
+    cell.text, gathered with one XPath call instead of per-run proxies.
+    """
+    parts = []
+    for node in element.xpath(_PARAGRAPHS_TEXT_XPATH):
+        tag = node.tag
+        if tag == _W_T:
+            parts.append(node.text or '')
+        elif tag == _W_BR:
+            # Line breaks read as newlines; page and column breaks as nothing
+            if node.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_ELEMENT_TEXT[tag])
+    text = ''.join(parts)
+    # Every paragraph, the first included, contributes a leading newline
+    return text[1:] if text.startswith('\n') else text
+
+
+def _style_key_for(style_name: str) -> str:
+    """Map a Word paragraph style name to the PDF style key it renders with."""
+    if style_name.startswith('Heading 1'):
+        return 'WordHeading1'
+    elif style_name.startswith('Heading'):
+        return 'WordHeading2'  # Use Heading2 for other heading levels
+    elif 'Title' in style_name:
+        return 'WordTitle'
+    return 'WordNormal'
+
+
+# Line prefixes the text-only conversion renders as bullet points
+_BULLET_PREFIXES = ('•', '-')
+# Most consecutive blank lines the text-only conversion renders as vertical space
+_MAX_BLANK_LINES = 4
+
 
 class WordToPdfService:
     """
@@ -76,6 +153,11 @@ class WordToPdfService:
     Handles DOCX and DOC files with structure preservation.
     """
     
+    # Parsed python-docx documents kept for reuse per service instance
+    DOC_CACHE_SIZE = 8
+    # Styling shared by every converted table, built on first use
+    _DEFAULT_TABLE_STYLE = None
+    
     def __init__(self):
         """Initialize the Word to PDF service."""
         if not REPORTLAB_AVAILABLE:
@@ -95,22 +177,65 @@ class WordToPdfService:
         
         # Prefer python-docx for structure, fallback to docx2txt for text
         self.use_structured_extraction = PYTHON_DOCX_AVAILABLE
+        
+        # Parsed documents keyed by (path, mtime, size), shared by metadata and conversion
+        self._doc_cache: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+        
+        # Stylesheet built on first conversion; building only reads the styles
+        self._styles = None
+        
+        # PDF style key per Word style name; documents reuse a handful of names
+        self._style_keys: Dict[str, str] = {}
+    
+    @staticmethod
+    def _file_key(file_path: str) -> Tuple[str, int, int]:
+        """Cheap identity of a file's current contents: (path, mtime_ns, size)."""
+        file_stat = os.stat(file_path)
+        return (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def _open_doc(self, word_path: str):
+        """Return the parsed python-docx Document for word_path, reusing a cached parse."""
+        key = self._file_key(word_path)
+        doc = self._doc_cache.get(key)
+        if doc is not None:
+            self._doc_cache.move_to_end(key)
+            return doc
+        
+        # Unzipping and parsing the package is the dominant cost; do it once per version
+        doc = Document(word_path)
+        self._doc_cache[key] = doc
+        while len(self._doc_cache) > self.DOC_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+        return doc
     
-    def get_word_metadata(self, word_path: str) -> Dict[str, Any]:
-        """Extract metadata from Word document."""
+    def get_word_metadata(self, word_path: str, doc=None,
+                          file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from Word document.
+        
+        Args:
+            word_path: Path to input Word file
+            doc: The file's python-docx Document, if the caller has already opened it
+            file_stat: os.stat() of word_path, if the caller already has it
+        
+        Returns:
+            Dict of document metadata, or {"error": ...} on failure
+        """
         try:
-            file_stat = os.stat(word_path)
+            if file_stat is None:
+                file_stat = os.stat(word_path)
             file_size_mb = file_stat.st_size / (1024 * 1024)
             
             metadata = {
                 "file_size_mb": round(file_size_mb, 3),
-                "file_format": pathlib.Path(word_path).suffix.lower()
+                "file_format": os.path.splitext(word_path)[1].lower()
             }
             
             # Try to extract document properties using python-docx
             if PYTHON_DOCX_AVAILABLE and Document and word_path.endswith('.docx'):
                 try:
-                    doc = Document(word_path)
+                    if doc is None:
+                        doc = self._open_doc(word_path)
                     
                     # Core properties
                     core_props = doc.core_properties
@@ -134,12 +259,10 @@ class WordToPdfService:
                         "has_tables": table_count > 0
                     })
                     
-                    # Word count (approximate)
-                    word_count = 0
-                    for paragraph in doc.paragraphs:
-                        word_count += len(paragraph.text.split())
-                    
-                    metadata["word_count"] = word_count
+                    # Word count (approximate). One XPath pass in libxml2 instead of
+                    # paragraph.text, which builds run proxies for every paragraph
+                    body_text = _paragraphs_text(doc.element.body)
+                    metadata["word_count"] = sum(1 for _ in _WORD_RE.finditer(body_text))
                     
                 except Exception as e:
                     logger.warning(f"Could not extract structured metadata: {e}")
@@ -159,7 +282,10 @@ class WordToPdfService:
             return {"error": str(e)}
     
     def _create_custom_styles(self):
-        """Create custom styles for Word document conversion."""
+        """Create custom styles for Word document conversion, once per service."""
+        if self._styles is not None:
+            return self._styles
+        
         styles = getSampleStyleSheet()
         
         # Custom styles for different Word elements
@@ -210,12 +336,14 @@ class WordToPdfService:
         # Add custom styles to the existing styles
         for name, style in custom_styles.items():
             styles.add(style)
-            
+        
+        self._styles = styles
         return styles
     
     def convert_word_to_pdf(self, word_path: str, pdf_path: str,
                           title: Optional[str] = None,
-                          preserve_structure: bool = True) -> bool:
+                          preserve_structure: bool = True,
+                          doc=None) -> bool:
         """
         Convert Word document to PDF with structure preservation.
         
@@ -224,6 +352,7 @@ class WordToPdfService:
             pdf_path: Path for output PDF file
             title: Custom title for the document
             preserve_structure: Whether to preserve document structure
+            doc: The file's python-docx Document, if the caller has already opened it
         
         Returns:
             bool: True if conversion successful, False otherwise
@@ -233,7 +362,7 @@ class WordToPdfService:
             
             # Determine conversion method
             if preserve_structure and self.use_structured_extraction and Document and word_path.endswith('.docx'):
-                return self._convert_with_structure(word_path, pdf_path, title)
+                return self._convert_with_structure(word_path, pdf_path, title, doc=doc)
             else:
                 return self._convert_text_only(word_path, pdf_path, title)
             
@@ -241,16 +370,19 @@ class WordToPdfService:
             logger.error(f"Failed to convert Word to PDF: {e}")
             return False
     
-    def _convert_with_structure(self, word_path: str, pdf_path: str, title: Optional[str] = None) -> bool:
+    def _convert_with_structure(self, word_path: str, pdf_path: str, title: Optional[str] = None,
+                                doc=None) -> bool:
         """Convert Word document preserving structure using python-docx."""
         try:
-            doc = Document(word_path) if Document else None
+            if doc is None:
+                doc = self._open_doc(word_path) if Document else None
             if not doc:
                 return self._convert_text_only(word_path, pdf_path, title)
             
-            # Create PDF document
+            # Create PDF document; it is built in memory and written out in one go
+            pdf_buffer = io.BytesIO()
             pdf_doc = SimpleDocTemplate(
-                pdf_path,
+                pdf_buffer,
                 pagesize=A4,
                 rightMargin=50,
                 leftMargin=50,
@@ -258,44 +390,16 @@ class WordToPdfService:
                 bottomMargin=50
             )
             
-            story = []
             styles = self._create_custom_styles()
+            doc_title = title or doc.core_properties.title or pathlib.Path(word_path).stem
             
-            # Add title
-            doc_title = title or (doc.core_properties.title if doc else None) or pathlib.Path(word_path).stem
-            story.append(Paragraph(doc_title, styles['WordTitle']))
-            story.append(Spacer(1, 20))
-            
-            # Process document elements
-            if doc:
-                for element in doc.element.body:
-                    if element.tag.endswith('p'):  # Paragraph
-                        para = None
-                        for p in doc.paragraphs:
-                            if p._element == element:
-                                para = p
-                                break
-                        
-                        if para and para.text.strip():
-                            # Determine paragraph style based on Word formatting
-                            style_name = self._determine_paragraph_style(para, styles)
-                            story.append(Paragraph(para.text, styles[style_name]))
-                    
-                    elif element.tag.endswith('tbl'):  # Table - FIXED INDENTATION
-                        table = None
-                        for t in doc.tables:
-                            if t._element == element:
-                                table = t
-                                break
-                        
-                        if table:
-                            pdf_table = self._convert_word_table(table)
-                            if pdf_table:
-                                story.append(pdf_table)
-                                story.append(Spacer(1, 12))
+            # SimpleDocTemplate.build consumes a list, so the flowables are
+            # collected only at this point
+            story = list(self._iter_flowables(doc, styles, doc_title))
             
             # Build PDF
             pdf_doc.build(story)
+            self._write_pdf(pdf_path, pdf_buffer.getbuffer())
             
             logger.info(f"Successfully converted Word to PDF with structure: {pdf_path}")
             return True
@@ -305,6 +409,50 @@ class WordToPdfService:
             # Fallback to text-only conversion
             return self._convert_text_only(word_path, pdf_path, title)
     
+    def _iter_flowables(self, doc, styles, doc_title: str) -> Iterator[Any]:
+        """Yield the title and then a flowable per non-empty paragraph and table of doc's body."""
+        # Add title
+        yield Paragraph(doc_title, styles['WordTitle'])
+        yield Spacer(1, 20)
+        
+        # Wrappers keyed by id() of their XML element, so each body element
+        # is matched with one dict lookup instead of a scan of every wrapper.
+        # The maps keep the wrappers, and so their elements, alive.
+        para_map = {id(p._element): p for p in doc.paragraphs}
+        table_map = {id(t._element): t for t in doc.tables}
+        normal_style = styles['WordNormal']
+        
+        # Process document elements. lxml filters the children by qualified
+        # tag in C, so sectPr and other body-level elements never reach here
+        for element in doc.element.body.iterchildren(_W_P, _W_TBL):
+            if element.tag == _W_P:  # Paragraph
+                para = para_map.get(id(element))
+                if not para:
+                    continue
+                
+                # paragraph.text is rebuilt from the runs on every access
+                para_text = para.text
+                if para_text.strip():
+                    # Most paragraphs carry no <w:pStyle> and use the default
+                    # (Normal) style; one C-level find settles those without
+                    # resolving paragraph.style through the styles part
+                    if element.find(_W_PSTYLE_PATH) is None:
+                        yield Paragraph(para_text, normal_style)
+                        continue
+                    
+                    # Determine paragraph style based on Word formatting
+                    style_name = self._determine_paragraph_style(para, styles)
+                    yield Paragraph(para_text, styles[style_name])
+            
+            else:  # Table
+                table = table_map.get(id(element))
+                
+                if table:
+                    pdf_table = self._convert_word_table(table)
+                    if pdf_table:
+                        yield pdf_table
+                        yield Spacer(1, 12)
+    
     def _convert_text_only(self, word_path: str, pdf_path: str, title: Optional[str] = None) -> bool:
         """Convert Word document as plain text using docx2txt."""
         try:
@@ -319,9 +467,10 @@ class WordToPdfService:
                 logger.error(f"No text extracted from Word document: {word_path}")
                 return False
             
-            # Create PDF document
-            pdf_doc = SimpleDocDocument(
-                pdf_path,
+            # Create PDF document; it is built in memory and written out in one go
+            pdf_buffer = io.BytesIO()
+            pdf_doc = SimpleDocTemplate(
+                pdf_buffer,
                 pagesize=A4,
                 rightMargin=50,
                 leftMargin=50,
@@ -337,28 +486,38 @@ class WordToPdfService:
             story.append(Paragraph(doc_title, styles['WordTitle']))
             story.append(Spacer(1, 20))
             
-            # Process text into paragraphs
-            paragraphs = text.split('\n')
+            # Process text into paragraphs; styles and story.append are bound
+            # once, outside what is usually the longest loop in the file
+            append = story.append
+            heading_style = styles['WordHeading1']
+            bullet_style = styles['WordBullet']
+            normal_style = styles['WordNormal']
             
-            for para_text in paragraphs:
+            # A run of blank lines becomes one Spacer, capped at _MAX_BLANK_LINES lines
+            blank_run = 0
+            for para_text in text.splitlines():
                 para_text = para_text.strip()
                 if not para_text:
-                    story.append(Spacer(1, 6))
+                    blank_run += 1
                     continue
+                if blank_run:
+                    append(Spacer(1, min(blank_run, _MAX_BLANK_LINES) * 6))
+                    blank_run = 0
                 
                 # Simple style detection
                 if len(para_text) < 100 and para_text.isupper():
                     # Likely a heading
-                    story.append(Paragraph(para_text, styles['WordHeading1']))
-                elif para_text.startswith('•') or para_text.startswith('-'):
+                    append(Paragraph(para_text, heading_style))
+                elif para_text.startswith(_BULLET_PREFIXES):
                     # Bullet point
-                    story.append(Paragraph(para_text, styles['WordBullet']))
+                    append(Paragraph(para_text, bullet_style))
                 else:
                     # Regular paragraph
-                    story.append(Paragraph(para_text, styles['WordNormal']))
+                    append(Paragraph(para_text, normal_style))
             
             # Build PDF
             pdf_doc.build(story)
+            self._write_pdf(pdf_path, pdf_buffer.getbuffer())
             
             logger.info(f"Successfully converted Word to PDF (text-only): {pdf_path}")
             return True
@@ -367,35 +526,36 @@ class WordToPdfService:
             logger.error(f"Text-only conversion failed: {e}")
             return False
     
+    @staticmethod
+    def _write_pdf(pdf_path: str, data) -> None:
+        """Write a finished PDF to a temp file with a single write, then move it into place."""
+        # Larger than the buffer, so BufferedWriter hands it straight to write(2)
+        with atomic_output(pdf_path) as out:
+            out.write(data)
+    
     def _determine_paragraph_style(self, paragraph, styles) -> str:
         """Determine appropriate PDF style for Word paragraph."""
-        try:
-            # Check if paragraph has a style
-            if paragraph.style.name.startswith('Heading 1'):
-                return 'WordHeading1'
-            elif paragraph.style.name.startswith('Heading 2'):
-                return 'WordHeading2'
-            elif paragraph.style.name.startswith('Heading'):
-                return 'WordHeading2'  # Use Heading2 for other heading levels
-            elif 'Title' in paragraph.style.name:
-                return 'WordTitle'
-            else:
-                return 'WordNormal'
-        except:
+        # The pStyle lookup finds no style when the id is unknown and the
+        # document has no default paragraph style; a style may also be unnamed
+        style = paragraph.style
+        name = style.name if style is not None else None
+        if not name:
             return 'WordNormal'
+        
+        style_key = self._style_keys.get(name)
+        if style_key is None:
+            style_key = self._style_keys[name] = _style_key_for(name)
+        return style_key
     
     def _convert_word_table(self, table):  # type: ignore
         """Convert Word table to ReportLab table."""
         try:
-            # Extract table data
-            table_data = []
-            
-            for row in table.rows:
-                row_data = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip() or " "  # Avoid empty cells
-                    row_data.append(cell_text)
-                table_data.append(row_data)
+            # Extract table data; each cell's text comes from one XPath call
+            # rather than cell.text's walk over paragraph and run proxies
+            table_data = [
+                [_paragraphs_text(cell._tc).strip() or " " for cell in row.cells]  # Avoid empty cells
+                for row in table.rows
+            ]
             
             if not table_data:
                 return None
@@ -404,7 +564,18 @@ class WordToPdfService:
             pdf_table = Table(table_data)
             
             # Apply basic table styling
-            table_style = TableStyle([
+            pdf_table.setStyle(self._table_style())  # type: ignore
+            return pdf_table
+            
+        except Exception as e:
+            logger.warning(f"Failed to convert table: {e}")
+            return None
+    
+    @classmethod
+    def _table_style(cls):
+        """Basic table styling, built once; Table.setStyle copies its commands."""
+        if cls._DEFAULT_TABLE_STYLE is None:
+            cls._DEFAULT_TABLE_STYLE = TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey if colors else 'grey'),  # type: ignore # Header background
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke if colors else 'whitesmoke'),  # type: ignore # Header text
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # Left align all
@@ -416,16 +587,41 @@ class WordToPdfService:
                 ('FONTSIZE', (0, 1), (-1, -1), 9),  # Data font size
                 ('GRID', (0, 0), (-1, -1), 1, colors.black if colors else 'black')  # type: ignore # Grid lines
             ])
-            
-            pdf_table.setStyle(table_style)  # type: ignore
-            return pdf_table
-            
-        except Exception as e:
-            logger.warning(f"Failed to convert table: {e}")
-            return None
+        return cls._DEFAULT_TABLE_STYLE
+    
+    def _convert_batch_file(self, file_path: str, file_stat: os.stat_result, pdf_path: str,
+                            preserve_structure: bool) -> Tuple[bool, Dict[str, Any]]:
+        """Convert one validated batch file, returning (success, result entry)."""
+        # Open a .docx once and hand the same Document to metadata and conversion
+        doc = None
+        if PYTHON_DOCX_AVAILABLE and Document and file_path.endswith('.docx'):
+            try:
+                doc = self._open_doc(file_path)
+            except Exception as e:
+                logger.warning(f"Could not open Word document {file_path}: {e}")
+        
+        # Get metadata
+        metadata = self.get_word_metadata(file_path, doc=doc, file_stat=file_stat)
+        
+        # Convert to PDF
+        success = self.convert_word_to_pdf(
+            file_path, pdf_path, preserve_structure=preserve_structure, doc=doc
+        )
+        
+        if success:
+            return True, {
+                "input_file": file_path,
+                "output_file": pdf_path,
+                "metadata": metadata
+            }
+        return False, {
+            "file": file_path,
+            "error": "Conversion failed"
+        }
     
     def batch_convert_words(self, input_files: List[str], output_dir: str = "output",
-                          preserve_structure: bool = True) -> Dict[str, Any]:
+                          preserve_structure: bool = True,
+                          max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Convert multiple Word files to PDF.
         
@@ -433,6 +629,8 @@ class WordToPdfService:
             input_files: List of Word file paths
             output_dir: Output directory for PDF files
             preserve_structure: Whether to preserve document structure
+            max_workers: Worker processes to convert with (default: CPU count);
+                1 converts in this process
         
         Returns:
             Dict containing conversion results
@@ -440,65 +638,96 @@ class WordToPdfService:
         output_path = pathlib.Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        results = {
-            "successful_conversions": [],
-            "failed_conversions": [],
-            "total_files": len(input_files),
-            "success_count": 0,
-            "failure_count": 0
-        }
+        # (success, entry) per input, filled in input order whatever the worker timing
+        outcomes: List[Optional[Tuple[bool, Dict[str, Any]]]] = [None] * len(input_files)
+        tasks: List[Tuple[int, str, os.stat_result, str]] = []
         
-        for file_path in input_files:
-            input_path = pathlib.Path(file_path)
-            
-            if not input_path.exists():
+        # Plain string path ops and one stat per file, which doubles as the
+        # existence check and is handed on to the metadata
+        for idx, file_path in enumerate(input_files):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 logger.error(f"File not found: {file_path}")
-                results["failed_conversions"].append({
+                outcomes[idx] = (False, {
                     "file": file_path,
                     "error": "File not found"
                 })
-                results["failure_count"] += 1
                 continue
             
             # Check if it's a supported Word file
-            if input_path.suffix.lower() not in self.supported_formats:
+            stem, suffix = os.path.splitext(os.path.basename(file_path))
+            if suffix.lower() not in self.supported_formats:
                 logger.error(f"Unsupported Word format: {file_path}")
-                results["failed_conversions"].append({
+                outcomes[idx] = (False, {
                     "file": file_path,
                     "error": "Unsupported Word format"
                 })
-                results["failure_count"] += 1
                 continue
             
             # Generate PDF path
-            pdf_filename = f"{input_path.stem}.pdf"
-            pdf_path = output_path / pdf_filename
-            
-            # Get metadata
-            metadata = self.get_word_metadata(file_path)
-            
-            # Convert to PDF
-            success = self.convert_word_to_pdf(
-                str(input_path), str(pdf_path), preserve_structure=preserve_structure
-            )
-            
-            if success:
-                results["successful_conversions"].append({
-                    "input_file": file_path,
-                    "output_file": str(pdf_path),
-                    "metadata": metadata
-                })
-                results["success_count"] += 1
-            else:
-                results["failed_conversions"].append({
-                    "file": file_path,
-                    "error": "Conversion failed"
-                })
-                results["failure_count"] += 1
+            pdf_path = os.path.join(output_dir, f"{stem}.pdf")
+            tasks.append((idx, file_path, file_stat, pdf_path))
+        
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        if workers <= 1 or len(tasks) <= 1:
+            # Not worth the process pool start-up cost
+            converted = [
+                self._convert_batch_file(file_path, file_stat, pdf_path, preserve_structure)
+                for _, file_path, file_stat, pdf_path in tasks
+            ]
+        else:
+            # python-docx parsing and ReportLab layout are CPU-bound Python,
+            # so independent files convert in parallel worker processes; spawn
+            # gives each a clean interpreter, as the text converter's pool does
+            workers = min(workers, len(tasks))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            ) as executor:
+                converted = list(executor.map(
+                    _convert_one,
+                    [file_path for _, file_path, _, _ in tasks],
+                    [file_stat for _, _, file_stat, _ in tasks],
+                    [pdf_path for _, _, _, pdf_path in tasks],
+                    [preserve_structure] * len(tasks),
+                    chunksize=max(1, len(tasks) // (4 * workers))
+                ))
+        
+        for (idx, _, _, _), outcome in zip(tasks, converted):
+            outcomes[idx] = outcome
+        
+        successful_conversions = [entry for success, entry in outcomes if success]
+        failed_conversions = [entry for success, entry in outcomes if not success]
+        
+        results = {
+            "successful_conversions": successful_conversions,
+            "failed_conversions": failed_conversions,
+            "total_files": len(input_files),
+            "success_count": len(successful_conversions),
+            "failure_count": len(failed_conversions)
+        }
         
         return results
 
 
+# Service instance reused by every file a batch worker process converts
+_WORKER_SERVICE: Optional[WordToPdfService] = None
+
+
+def _init_worker():
+    """Process pool initializer: build the worker's service before its first file."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = WordToPdfService()
+
+
+def _convert_one(file_path: str, file_stat: os.stat_result, pdf_path: str,
+                 preserve_structure: bool) -> Tuple[bool, Dict[str, Any]]:
+    """Convert one validated batch file inside a worker process."""
+    return _WORKER_SERVICE._convert_batch_file(file_path, file_stat, pdf_path, preserve_structure)
+
+
 if __name__ == "__main__":
     """Command-line interface for Word to PDF conversion."""
     import argparse
@@ -509,6 +738,8 @@ if __name__ == "__main__":
     parser.add_argument("--title", help="Custom document title")
     parser.add_argument("--no-structure", action="store_true", 
                        help="Convert as plain text (faster)")
+    parser.add_argument("-j", "--jobs", type=int,
+                       help="Worker processes for batch conversion (default: CPU count)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     
     args = parser.parse_args()
@@ -544,7 +775,8 @@ if __name__ == "__main__":
             # Batch conversion
             print(f"Converting {len(args.input)} Word file(s)...")
             results = service.batch_convert_words(
-                args.input, args.output, preserve_structure=not args.no_structure
+                args.input, args.output, preserve_structure=not args.no_structure,
+                max_workers=args.jobs
             )
             
             print(f"\n📊 Results:")